@@ -0,0 +1,41 @@
+"""Tests for how provider failures are classified."""
+
+from __future__ import annotations
+
+import pytest
+
+from wormhole.errors import TranslationProviderError, TranslationServiceUnavailableError
+from wormhole.providers import _service_unavailable
+
+
+class _StatusError(Exception):
+    def __init__(self, status_code: int) -> None:
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+@pytest.mark.parametrize("status_code", [408, 429, 500, 503])
+def test_rate_limits_and_server_errors_are_unavailable(status_code: int) -> None:
+    error = _service_unavailable(_StatusError(status_code))
+
+    assert isinstance(error, TranslationServiceUnavailableError)
+
+
+@pytest.mark.parametrize("status_code", [400, 404, 413, 422])
+def test_rejected_requests_are_not_unavailable(status_code: int) -> None:
+    error = _service_unavailable(_StatusError(status_code))
+
+    assert isinstance(error, TranslationProviderError)
+    assert not isinstance(error, TranslationServiceUnavailableError)
+
+
+def test_connection_errors_are_unavailable() -> None:
+    error = _service_unavailable(ConnectionResetError("connection reset"))
+
+    assert isinstance(error, TranslationServiceUnavailableError)
+
+
+def test_other_exceptions_are_not_unavailable() -> None:
+    error = _service_unavailable(ValueError("bad payload"))
+
+    assert not isinstance(error, TranslationServiceUnavailableError)
@@ -0,0 +1,100 @@
+"""Tests for batch retries and splitting in the translation runner."""
+
+from __future__ import annotations
+
+import asyncio
+import pathlib
+from typing import Dict, List, Sequence
+
+from wormhole.errors import TranslationProviderError
+from wormhole.providers import TranslationProvider
+from wormhole.structures import Batch, TextSegment
+from wormhole.translator import TranslationRunner, _SegmentBuffers
+
+
+class _FailingProvider(TranslationProvider):
+    """Fails every call that includes ``bad_text``; echoes the rest upper-cased."""
+
+    def __init__(self, bad_text: str) -> None:
+        self.bad_text = bad_text
+        self.calls: List[List[str]] = []
+
+    def translate(
+        self,
+        segments: Sequence[TextSegment],
+        *,
+        source_language: str | None,
+        target_language: str,
+        model: str | None = None,
+    ) -> Dict[str, str]:
+        self.calls.append([segment.text for segment in segments])
+        if any(segment.text == self.bad_text for segment in segments):
+            raise TranslationProviderError("Translation provider response malformed.")
+        return {segment.segment_id: segment.text.upper() for segment in segments}
+
+
+def _runner(tmp_path: pathlib.Path) -> TranslationRunner:
+    runner = TranslationRunner(
+        input_path=tmp_path / "in.docx",
+        output_path=tmp_path / "out.docx",
+        target_language="fr",
+        source_language=None,
+        provider_name="echo",
+        model=None,
+        batch_budget=2000,
+        interactive=False,
+        verbose=True,
+        provider_debug=False,
+        concurrency=1,
+        max_retries=1,
+    )
+    runner.retry_base_delay = 0.0
+    return runner
+
+
+def _batch(texts: Sequence[str], buffers: _SegmentBuffers) -> Batch:
+    buffers.add_unit("u", len(texts))
+    segments = [
+        TextSegment(segment_id=f"u#seg{index}", unit_id="u", text=text, order=index)
+        for index, text in enumerate(texts)
+    ]
+    return Batch(batch_id=1, segments=segments)
+
+
+def test_skipping_one_half_still_translates_the_other(tmp_path: pathlib.Path) -> None:
+    runner = _runner(tmp_path)
+    provider = _FailingProvider("This is a test.")
+    buffers = _SegmentBuffers()
+    batch = _batch(["This is a test.", "x", "  "], buffers)
+
+    runner._process_batch(provider=provider, batch=batch, buffers=buffers)
+
+    assert provider.calls == [
+        ["This is a test.", "x", "  "],
+        ["This is a test."],
+        ["x", "  "],
+    ]
+    assert buffers.get(batch.segments[0]) is None
+    assert buffers.get(batch.segments[1]) == "X"
+    assert buffers.get(batch.segments[2]) == "  "
+    assert len(runner.error_policy.records) == 1
+    assert "segments u#seg0 to u#seg0" in runner.error_policy.records[0].message
+
+
+def test_async_skipping_one_half_still_translates_the_other(
+    tmp_path: pathlib.Path,
+) -> None:
+    runner = _runner(tmp_path)
+    provider = _FailingProvider("x")
+    buffers = _SegmentBuffers()
+    batch = _batch(["This is a test.", "x", "  "], buffers)
+
+    asyncio.run(
+        runner._process_batch_async(provider=provider, batch=batch, buffers=buffers)
+    )
+
+    assert buffers.get(batch.segments[0]) == "THIS IS A TEST."
+    assert buffers.get(batch.segments[1]) is None
+    assert buffers.get(batch.segments[2]) is None
+    assert ["This is a test."] in provider.calls
+    assert len(runner.error_policy.records) == 1
@@ -4,25 +4,62 @@ from __future__ import annotations
 
 import argparse
 import os
-import pathlib
-import re
+import string
 import sys
-from typing import Iterable, Optional
-
-from dotenv import load_dotenv
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, Iterable, Optional
 
 from .errors import (
     AbortRequested,
     NonInteractiveAbort,
-    OverwriteRefusedError,
     TranslationProviderConfigurationError,
     UnsupportedFileTypeError,
     WormholeError,
 )
-from .translator import TranslationRunner, TranslationSummary, validate_paths
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    import pathlib
+
+    from .translator import TranslationSummary
+
+
+class _FilenameTable(dict):
+    """Translation table that keeps only ASCII letters, digits, and hyphens."""
+
+    def __missing__(self, codepoint: int) -> None:
+        return None
+
+
+_ALLOWED = string.ascii_letters + string.digits + "-"
+_FILENAME_TABLE = _FilenameTable({ord(char): ord(char) for char in _ALLOWED})
+_TRUTHY = frozenset(("1", "true", "yes", "on"))
+_DEBUG_ENV_NAMES = ("WORMHOLE_PROVIDER_DEBUG", "WORMHOLE_DEBUG_PROVIDER")
+
+# Exit code and message builder per exception raised during a translation run.
+_EXIT_MAP: dict[type[BaseException], tuple[int, Callable[[BaseException], str]]] = {
+    UnsupportedFileTypeError: (1, str),
+    TranslationProviderConfigurationError: (1, str),
+    NonInteractiveAbort: (2, str),
+    AbortRequested: (2, lambda exc: "Translation aborted at your request."),
+    WormholeError: (1, str),
+    KeyboardInterrupt: (2, lambda exc: "Translation interrupted by user."),
+}
+_EXIT_TYPES = tuple(_EXIT_MAP)
+
+
+_PARSER: argparse.ArgumentParser | None = None
 
 
 def build_parser() -> argparse.ArgumentParser:
+    """Return the shared argument parser, constructing it on first use."""
+
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = _build_parser()
+    return _PARSER
+
+
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="wormhole",
         description=(
@@ -84,6 +121,14 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Show detailed progress information.",
     )
+    parser.add_argument(
+        "--batch-api",
+        action="store_true",
+        help=(
+            "Submit all batches as one OpenAI Batch API job: cheaper, but the "
+            "run waits until the job completes (up to 24 hours)."
+        ),
+    )
     parser.add_argument(
         "--debug-provider",
         action="store_true",
@@ -97,30 +142,31 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+@lru_cache(maxsize=128)
 def sanitise_language_for_filename(language: str) -> str:
     """Generate a filesystem-friendly suffix from a language descriptor."""
 
-    collapsed = re.sub(r"\s+", "-", language.strip())
-    ascii_only = collapsed.encode("ascii", "ignore").decode("ascii")
-    cleaned = re.sub(r"[^A-Za-z0-9\-]+", "", ascii_only)
-    return cleaned or "translated"
+    return "-".join(language.split()).translate(_FILENAME_TABLE) or "translated"
+
+
+@lru_cache(maxsize=256)
+def _derive_cached(stem: str, suffix: str, language: str) -> str:
+    return f"{stem}_{sanitise_language_for_filename(language)}{suffix}"
 
 
 def derive_output_path(input_path: pathlib.Path, language: str) -> pathlib.Path:
-    suffix = input_path.suffix
-    stem = input_path.stem
-    addition = sanitise_language_for_filename(language)
-    candidate = f"{stem}_{addition}{suffix}"
+    candidate = _derive_cached(input_path.stem, input_path.suffix, language)
     return input_path.with_name(candidate)
 
 
 def _env_flag(*names: str) -> bool:
     """Interpret boolean-like environment variables."""
 
-    truthy = {"1", "true", "yes", "on"}
     for name in names:
-        value = os.getenv(name)
-        if value is not None and value.strip().lower() in truthy:
+        value = os.environ.get(name)
+        if value is None:
+            continue
+        if value.strip().lower() in _TRUTHY:
             return True
     return False
 
@@ -138,23 +184,28 @@ def execute_translation(
     non_interactive: bool,
     verbose: bool,
     provider_debug: bool,
+    use_batch_api: bool = False,
 ) -> tuple[int, TranslationSummary | None, str | None]:
     """Execute a translation run and return the exit code, summary, and message."""
 
-    input_path = pathlib.Path(input_file).expanduser().resolve()
+    # Imported lazily so --help and argument errors skip the provider SDK graph.
+    import pathlib
+
+    from .translator import TranslationRunner, validate_paths
+
+    # abspath avoids resolve()'s per-component stat calls; validate_paths
+    # checks identity by stat, which also catches symlinks and hardlinks to
+    # the source.
+    input_path = pathlib.Path(os.path.abspath(os.path.expanduser(input_file)))
     output_path = (
-        pathlib.Path(output_file).expanduser().resolve()
+        pathlib.Path(os.path.abspath(os.path.expanduser(output_file)))
         if output_file
         else derive_output_path(input_path, target_language)
     )
 
     try:
         validate_paths(input_path, output_path, force_overwrite=force_overwrite)
-    except FileNotFoundError as exc:
-        return 1, None, str(exc)
-    except OverwriteRefusedError as exc:
-        return 1, None, str(exc)
-    except WormholeError as exc:
+    except (FileNotFoundError, WormholeError) as exc:
         return 1, None, str(exc)
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -170,22 +221,18 @@ def execute_translation(
         interactive=not non_interactive,
         verbose=verbose,
         provider_debug=provider_debug,
+        use_batch_api=use_batch_api,
     )
 
     try:
         summary = runner.run()
-    except UnsupportedFileTypeError as exc:
-        return 1, None, str(exc)
-    except TranslationProviderConfigurationError as exc:
-        return 1, None, str(exc)
-    except NonInteractiveAbort as exc:
-        return 2, None, str(exc)
-    except AbortRequested:
-        return 2, None, "Translation aborted at your request."
-    except WormholeError as exc:
-        return 1, None, str(exc)
-    except KeyboardInterrupt:
-        return 2, None, "Translation interrupted by user."
+    except _EXIT_TYPES as exc:
+        # Walk the MRO so subclasses resolve to their closest mapped ancestor.
+        for cls in type(exc).__mro__:
+            if cls in _EXIT_MAP:
+                code, build_message = _EXIT_MAP[cls]
+                return code, None, build_message(exc)
+        raise  # pragma: no cover - every caught type is mapped
     except Exception as exc:  # pragma: no cover - defensive catch
         error_message = (
             f"{exc}\n"
@@ -199,41 +246,47 @@ def execute_translation(
 def print_summary(summary: TranslationSummary) -> None:
     """Output a friendly report once processing completes."""
 
-    print("\nTranslation complete.")
-    print(f"  Input file:      {summary.input_path}")
-    print(f"  Output file:     {summary.output_path}")
-    print(f"  Document type:   {summary.document_type}")
-    print(
+    lines: list[str] = ["", "Translation complete."]
+    lines.append(f"  Input file:      {summary.input_path}")
+    lines.append(f"  Output file:     {summary.output_path}")
+    lines.append(f"  Document type:   {summary.document_type}")
+    lines.append(
         "  Text units:      "
         f"{summary.translated_units} translated / {summary.total_units} total "
         f"({summary.skipped_units} skipped)"
     )
-    print(
+    lines.append(
         f"  Segments:        {summary.total_segments} "
         f"in {summary.total_batches} batches"
     )
-    print(
+    lines.append(
         f"  Provider:        {summary.provider_name}"
         + (f" ({summary.model})" if summary.model else "")
     )
     if summary.source_language:
-        print(f"  Source language: {summary.source_language}")
-    print(f"  Target language: {summary.target_language}")
-    print(f"  Elapsed time:    {summary.elapsed_seconds:.2f} seconds")
+        lines.append(f"  Source language: {summary.source_language}")
+    lines.append(f"  Target language: {summary.target_language}")
+    lines.append(f"  Elapsed time:    {summary.elapsed_seconds:.2f} seconds")
     if summary.total_errors:
-        print("  Notes:")
-        for message in summary.error_messages:
-            print(f"    - {message}")
+        lines.append("  Notes:")
+        for record in summary.error_records:
+            lines.append(f"    - {record.message}")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main(argv: Optional[Iterable[str]] = None) -> int:
-    load_dotenv()
     parser = build_parser()
-    args = parser.parse_args(list(argv) if argv is not None else None)
+    args = parser.parse_args(
+        None if argv is None else (argv if isinstance(argv, list) else list(argv))
+    )
+
+    from dotenv import load_dotenv
+
+    load_dotenv()
 
     provider_debug = bool(
         args.debug_provider
-        or _env_flag("WORMHOLE_PROVIDER_DEBUG", "WORMHOLE_DEBUG_PROVIDER")
+        or _env_flag(*_DEBUG_ENV_NAMES)
     )
 
     if args.gui:
@@ -263,6 +316,7 @@ def main(argv: Optional[Iterable[str]] = None) -> int:
         non_interactive=args.non_interactive,
         verbose=args.verbose,
         provider_debug=provider_debug,
+        use_batch_api=args.batch_api,
     )
 
     if message:
@@ -3,37 +3,82 @@
 from __future__ import annotations
 
 import html
+import itertools
 import pathlib
-import re
-from abc import ABC, abstractmethod
-from typing import Dict, Iterable, List, Sequence, Tuple
+import sys
+from functools import lru_cache, partial
+from typing import Callable, Dict, Iterable, Iterator, List, Sequence, Tuple
 
 from .errors import UnsupportedFileTypeError, WormholeError
 from .structures import TextUnit
 
 
-RUN_TAG_PATTERN = re.compile(
-    r"<run\s+id=\"(?P<id>[^\"]+)\">(?P<content>.*?)</run>",
-    re.DOTALL,
-)
+_RUN_OPEN = "<run"
+_RUN_ID_ATTR = 'id="'
+_RUN_CLOSE = "</run>"
+_RUN_OPEN_ID = _RUN_OPEN + " " + _RUN_ID_ATTR
+_BODY_PARAGRAPH_PREFIX = "body.p"
+_W_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+_W_RPR = f"{{{_W_NAMESPACE}}}rPr"
+_W_T = f"{{{_W_NAMESPACE}}}t"
+_W_P = f"{{{_W_NAMESPACE}}}p"
+_W_TBL = f"{{{_W_NAMESPACE}}}tbl"
+_XML_SPACE = "{http://www.w3.org/XML/1998/namespace}space"
+
+
+def _iter_run_tags(translated: str) -> Iterator[Tuple[int, int, str, str]]:
+    """Yield ``(start, end, run_id, content)`` for each `<run id="">` tag.
+
+    A flat ``str.find`` scanner equivalent to matching
+    ``<run\\s+id="([^"]+)">(.*?)</run>`` with DOTALL, without regex overhead.
+    """
+
+    length = len(translated)
+    search = 0
+    while True:
+        start = translated.find(_RUN_OPEN, search)
+        if start == -1:
+            return
+        search = start + 1
+        attr = start + len(_RUN_OPEN)
+        if translated.startswith(_RUN_OPEN_ID, start):
+            # Fast path for the exact tag shape Wormhole emits.
+            id_start = start + len(_RUN_OPEN_ID)
+        else:
+            cursor = attr
+            while cursor < length and translated[cursor].isspace():
+                cursor += 1
+            if cursor == attr or not translated.startswith(_RUN_ID_ATTR, cursor):
+                continue
+            id_start = cursor + len(_RUN_ID_ATTR)
+        id_end = translated.find('"', id_start)
+        if id_end <= id_start or not translated.startswith(">", id_end + 1):
+            continue
+        content_start = id_end + 2
+        content_end = translated.find(_RUN_CLOSE, content_start)
+        if content_end == -1:
+            return
+        end = content_end + len(_RUN_CLOSE)
+        yield start, end, translated[id_start:id_end], translated[content_start:content_end]
+        search = end
 
 
 def _parse_tagged_translation(
     translated: str,
     expected_ids: Sequence[str],
-) -> Dict[str, str]:
-    """Parse `<run id="">` tagged content and map ids to translated text."""
+) -> List[str]:
+    """Parse `<run id="">` tagged content into texts ordered like ``expected_ids``."""
 
     mapping: Dict[str, str] = {}
+    known_ids = frozenset(expected_ids)
     cursor = 0
-    for match in RUN_TAG_PATTERN.finditer(translated):
-        prefix = translated[cursor:match.start()]
+    for start, end, run_id, content in _iter_run_tags(translated):
+        prefix = translated[cursor:start]
         if prefix.strip():
             raise WormholeError(
                 "Translated output contained unexpected content outside <run> tags."
             )
-        run_id = match.group("id")
-        if run_id not in expected_ids:
+        if run_id not in known_ids:
             raise WormholeError(
                 f"Translated output contained an unknown run id '{run_id}'."
             )
@@ -41,9 +86,8 @@ def _parse_tagged_translation(
             raise WormholeError(
                 f"Translated output duplicated run id '{run_id}'."
             )
-        content = html.unescape(match.group("content"))
-        mapping[run_id] = content
-        cursor = match.end()
+        mapping[run_id] = html.unescape(content) if "&" in content else content
+        cursor = end
 
     suffix = translated[cursor:]
     if suffix.strip():
@@ -58,7 +102,44 @@ def _parse_tagged_translation(
             + ", ".join(missing)
         )
 
-    return mapping
+    return [mapping[run_id] for run_id in expected_ids]
+
+
+def _maybe_escape(text: str) -> str:
+    """Escape markup characters, skipping the work for plain text."""
+
+    if "&" in text or "<" in text or ">" in text:
+        return html.escape(text, quote=False)
+    return text
+
+
+def _set_run_text(run, text: str) -> None:
+    """Write text onto a run through its ``text`` property."""
+
+    run.text = text
+
+
+def _set_docx_run_text(run, text: str) -> None:
+    """Write text onto a Word run, updating a lone ``<w:t>`` in place.
+
+    ``Run.text`` clears the run and rebuilds its content character by
+    character. When the run holds a single ``<w:t>`` and the text has no tabs
+    or line breaks the result is the same element with new text, so it is
+    written directly.
+    """
+
+    if text and "\t" not in text and "\n" not in text and "\r" not in text:
+        r = run._r
+        content = [child for child in r if child.tag != _W_RPR]
+        if len(content) == 1 and content[0].tag == _W_T:
+            t = content[0]
+            t.text = text
+            if len(text.strip()) < len(text):
+                t.set(_XML_SPACE, "preserve")
+            else:
+                t.attrib.pop(_XML_SPACE, None)
+            return
+    run.text = text
 
 
 def _build_units_from_runs(
@@ -66,53 +147,46 @@ def _build_units_from_runs(
     *,
     unit_prefix: str,
     location: str,
+    write_run: Callable[[object, str], None] = _set_run_text,
 ) -> List[TextUnit]:
     """Aggregate paragraph runs into a single translation unit."""
 
     fragments: List[Tuple[str, object, str]] = []
+    prefix_dot = unit_prefix + ".r"
     for r_idx, run in enumerate(runs):
         text = getattr(run, "text", "")
         if text is None:
             continue
         if not text or not text.strip():
             continue
-        fragment_id = f"{unit_prefix}.r{r_idx}"
-        fragments.append((fragment_id, run, text))
+        fragments.append((prefix_dot + str(r_idx), run, text))
 
     if not fragments:
         return []
 
     if len(fragments) == 1:
         fragment_id, run, text = fragments[0]
-
-        def _single_setter(translated: str) -> None:
-            setattr(run, "text", translated)
-
         return [
             TextUnit(
                 unit_id=fragment_id,
                 original_text=text,
-                setter=_single_setter,
+                setter=partial(write_run, run),
                 location=location,
                 atomic=False,
             )
         ]
 
-    parts = [
-        f'<run id="{fragment_id}">{html.escape(text, quote=False)}</run>'
+    original_text = "".join(
+        f'<run id="{fragment_id}">{_maybe_escape(text)}</run>'
         for fragment_id, _, text in fragments
-    ]
-    original_text = "".join(parts)
+    )
 
-    fragment_ids = [fragment_id for fragment_id, _, _ in fragments]
-    setters = {fragment_id: run for fragment_id, run, _ in fragments}
+    fragment_ids, fragment_runs, _ = zip(*fragments)
 
     def _setter(translated: str) -> None:
-        mapping = _parse_tagged_translation(translated, fragment_ids)
-        for fragment_id in fragment_ids:
-            run = setters[fragment_id]
-            new_text = mapping[fragment_id]
-            setattr(run, "text", new_text)
+        texts = _parse_tagged_translation(translated, fragment_ids)
+        for run, new_text in zip(fragment_runs, texts):
+            write_run(run, new_text)
 
     unit = TextUnit(
         unit_id=unit_prefix,
@@ -124,43 +198,86 @@ def _build_units_from_runs(
     return [unit]
 
 
+@lru_cache(maxsize=None)
+def _docx_xpath(expression: str):
+    """Compile a WordprocessingML XPath expression once per process."""
+
+    from lxml import etree  # type: ignore
+
+    return etree.XPath(expression, namespaces={"w": _W_NAMESPACE})
+
+
+def _iter_docx_cells(table) -> Iterator[Tuple[int, int, object]]:
+    """Yield ``(row, grid column, cell)`` once per ``<w:tc>`` of a Word table.
+
+    Walking the table XML directly avoids the duplicate cell wrappers that
+    ``row.cells`` synthesises for merged cells.
+    """
+
+    from docx.table import _Cell  # type: ignore
+
+    for r_idx, tr in enumerate(table._tbl.tr_lst):
+        c_idx = 0
+        for tc in tr.tc_lst:
+            if tc.vMerge != "continue":
+                yield r_idx, c_idx, _Cell(tc, table)
+            c_idx += tc.grid_span
+
+
+_DOCUMENT_CLS = None
+_PRESENTATION_CLS = None
+
+
 def _import_docx():
-    try:
-        from docx import Document  # type: ignore
-    except ImportError as exc:  # pragma: no cover - import guard
-        raise WormholeError(
-            "python-docx is required to process .docx files. "
-            "Install the optional dependency with `pip install python-docx`."
-        ) from exc
-    return Document
+    global _DOCUMENT_CLS
+    if _DOCUMENT_CLS is None:
+        try:
+            from docx import Document  # type: ignore
+        except ImportError as exc:  # pragma: no cover - import guard
+            raise WormholeError(
+                "python-docx is required to process .docx files. "
+                "Install the optional dependency with `pip install python-docx`."
+            ) from exc
+        _DOCUMENT_CLS = Document
+    return _DOCUMENT_CLS
 
 
 def _import_pptx():
-    try:
-        from pptx import Presentation  # type: ignore
-    except ImportError as exc:  # pragma: no cover - import guard
-        raise WormholeError(
-            "python-pptx is required to process .pptx files. "
-            "Install the optional dependency with `pip install python-pptx`."
-        ) from exc
-    return Presentation
+    global _PRESENTATION_CLS
+    if _PRESENTATION_CLS is None:
+        try:
+            from pptx import Presentation  # type: ignore
+        except ImportError as exc:  # pragma: no cover - import guard
+            raise WormholeError(
+                "python-pptx is required to process .pptx files. "
+                "Install the optional dependency with `pip install python-pptx`."
+            ) from exc
+        _PRESENTATION_CLS = Presentation
+    return _PRESENTATION_CLS
 
 
-class BaseDocumentHandler(ABC):
+class BaseDocumentHandler:
     """Common base class for document handlers."""
 
     def __init__(self, source_path: pathlib.Path):
         self.source_path = source_path
         self.units: List[TextUnit] = []
 
-    @abstractmethod
     def extract_text_units(self) -> List[TextUnit]:
         """Extract translation-ready text units."""
 
-    @abstractmethod
+        return self.register_units(self.iter_text_units())
+
+    def iter_text_units(self) -> Iterator[TextUnit]:
+        """Yield translation-ready text units lazily, in document order."""
+
+        raise NotImplementedError
+
     def save(self, destination: pathlib.Path) -> None:
         """Persist the translated document."""
 
+        raise NotImplementedError
+
     def register_units(self, units: Iterable[TextUnit]) -> List[TextUnit]:
         """Store and return the provided units."""
 
@@ -176,95 +293,94 @@ class DocxDocumentHandler(BaseDocumentHandler):
         Document = _import_docx()
         self.document = Document(str(source_path))
 
-    def extract_text_units(self) -> List[TextUnit]:
-        units: List[TextUnit] = []
-        units.extend(self._extract_body())
-        units.extend(self._extract_tables())
-        units.extend(self._extract_headers_and_footers())
-        return self.register_units(units)
+    def iter_text_units(self) -> Iterator[TextUnit]:
+        return itertools.chain(
+            self._extract_body_and_tables(),
+            self._extract_headers_and_footers(),
+        )
 
     def save(self, destination: pathlib.Path) -> None:
         self.document.save(str(destination))
 
     # --- Internal helpers -------------------------------------------------
 
-    def _extract_body(self) -> List[TextUnit]:
-        units: List[TextUnit] = []
-        for p_idx, paragraph in enumerate(self.document.paragraphs):
-            units.extend(
-                self._extract_runs(
-                    paragraph.runs,
-                    unit_prefix=f"body.p{p_idx}",
-                    location=f"Body paragraph {p_idx + 1}",
-                )
+    def _extract_body_and_tables(self) -> Iterator[TextUnit]:
+        """Walk the body children once, emitting paragraphs before tables."""
+
+        from docx.table import Table  # type: ignore
+        from docx.text.paragraph import Paragraph  # type: ignore
+
+        container = self.document._body  # type: ignore[attr-defined]
+        tables = []
+        p_idx = 0
+        for child in self.document.element.body.iterchildren(_W_P, _W_TBL):
+            if child.tag == _W_TBL:
+                tables.append(Table(child, container))
+                continue
+            yield from self._extract_runs(
+                Paragraph(child, container).runs,
+                unit_prefix=_BODY_PARAGRAPH_PREFIX + str(p_idx),
+                location=f"Body paragraph {p_idx + 1}",
             )
-        return units
-
-    def _extract_tables(self) -> List[TextUnit]:
-        units: List[TextUnit] = []
-        processed_cells = set()
-        for t_idx, table in enumerate(self.document.tables):
-            for r_idx, row in enumerate(table.rows):
-                for c_idx, cell in enumerate(row.cells):
-                    cell_key = id(cell._tc)  # type: ignore[attr-defined]
-                    if cell_key in processed_cells:
-                        continue
-                    processed_cells.add(cell_key)
-                    base_prefix = (
-                        f"body.table{t_idx}.row{r_idx}.cell{c_idx}"
-                    )
-                    location = (
-                        f"Table {t_idx + 1}, row {r_idx + 1}, column {c_idx + 1}"
+            p_idx += 1
+
+        for t_idx, table in enumerate(tables):
+            for r_idx, c_idx, cell in _iter_docx_cells(table):
+                paragraph_prefix = (
+                    f"body.table{t_idx}.row{r_idx}.cell{c_idx}.p"
+                )
+                location = sys.intern(
+                    f"Table {t_idx + 1}, row {r_idx + 1}, column {c_idx + 1}"
+                )
+                for cp_idx, paragraph in enumerate(cell.paragraphs):
+                    yield from self._extract_runs(
+                        paragraph.runs,
+                        unit_prefix=paragraph_prefix + str(cp_idx),
+                        location=location,
                     )
-                    for p_idx, paragraph in enumerate(cell.paragraphs):
-                        units.extend(
-                            self._extract_runs(
-                                paragraph.runs,
-                                unit_prefix=f"{base_prefix}.p{p_idx}",
-                                location=location,
-                            )
-                        )
-        return units
 
-    def _extract_headers_and_footers(self) -> List[TextUnit]:
-        units: List[TextUnit] = []
+    def _extract_headers_and_footers(self) -> Iterator[TextUnit]:
         for s_idx, section in enumerate(self.document.sections):
-            header = section.header
-            footer = section.footer
-            for name, container in (("header", header), ("footer", footer)):
-                for p_idx, paragraph in enumerate(container.paragraphs):
-                    units.extend(
-                        self._extract_runs(
+            yield from self._extract_section(s_idx, section)
+
+    def _extract_section(self, s_idx: int, section) -> Iterator[TextUnit]:
+        from docx.table import Table  # type: ignore
+        from docx.text.paragraph import Paragraph  # type: ignore
+
+        paragraphs_xpath = _docx_xpath("./w:p")
+        tables_xpath = _docx_xpath("./w:tbl")
+        header = section.header
+        footer = section.footer
+        for name, container in (("header", header), ("footer", footer)):
+            # Resolve the part element once; every .paragraphs/.tables access
+            # would otherwise look up (or add) the header definition again.
+            element = container._element
+            container_prefix = f"section{s_idx}.{name}"
+            container_location = sys.intern(f"Section {s_idx + 1} {name}")
+            paragraph_prefix = container_prefix + ".p"
+            for p_idx, p in enumerate(paragraphs_xpath(element)):
+                yield from self._extract_runs(
+                    Paragraph(p, container).runs,
+                    unit_prefix=paragraph_prefix + str(p_idx),
+                    location=container_location,
+                )
+            for t_idx, tbl in enumerate(tables_xpath(element)):
+                table = Table(tbl, container)
+                for r_idx, c_idx, cell in _iter_docx_cells(table):
+                    cell_prefix = (
+                        f"{container_prefix}.table{t_idx}"
+                        f".row{r_idx}.cell{c_idx}.p"
+                    )
+                    location = sys.intern(
+                        f"{container_location} table {t_idx + 1}, "
+                        f"row {r_idx + 1}, column {c_idx + 1}"
+                    )
+                    for p_idx, paragraph in enumerate(cell.paragraphs):
+                        yield from self._extract_runs(
                             paragraph.runs,
-                            unit_prefix=f"section{s_idx}.{name}.p{p_idx}",
-                            location=f"Section {s_idx + 1} {name}",
+                            unit_prefix=cell_prefix + str(p_idx),
+                            location=location,
                         )
-                    )
-                processed_cells = set()
-                for t_idx, table in enumerate(container.tables):
-                    for r_idx, row in enumerate(table.rows):
-                        for c_idx, cell in enumerate(row.cells):
-                            cell_key = id(cell._tc)  # type: ignore[attr-defined]
-                            if cell_key in processed_cells:
-                                continue
-                            processed_cells.add(cell_key)
-                            base_prefix = (
-                                f"section{s_idx}.{name}.table{t_idx}"
-                                f".row{r_idx}.cell{c_idx}"
-                            )
-                            location = (
-                                f"Section {s_idx + 1} {name} table {t_idx + 1}, "
-                                f"row {r_idx + 1}, column {c_idx + 1}"
-                            )
-                            for p_idx, paragraph in enumerate(cell.paragraphs):
-                                units.extend(
-                                    self._extract_runs(
-                                        paragraph.runs,
-                                        unit_prefix=f"{base_prefix}.p{p_idx}",
-                                        location=location,
-                                    )
-                                )
-        return units
 
     def _extract_runs(
         self,
@@ -277,6 +393,7 @@ class DocxDocumentHandler(BaseDocumentHandler):
             runs,
             unit_prefix=unit_prefix,
             location=location,
+            write_run=_set_docx_run_text,
         )
 
 
@@ -288,76 +405,64 @@ class PptxDocumentHandler(BaseDocumentHandler):
         Presentation = _import_pptx()
         self.presentation = Presentation(str(source_path))
 
-    def extract_text_units(self) -> List[TextUnit]:
-        units: List[TextUnit] = []
-        units.extend(self._extract_slide_content())
-        units.extend(self._extract_notes())
-        return self.register_units(units)
+    def iter_text_units(self) -> Iterator[TextUnit]:
+        return itertools.chain(self._extract_slide_content(), self._extract_notes())
 
     def save(self, destination: pathlib.Path) -> None:
         self.presentation.save(str(destination))
 
     # --- Internal helpers -------------------------------------------------
 
-    def _extract_slide_content(self) -> List[TextUnit]:
-        units: List[TextUnit] = []
+    def _extract_slide_content(self) -> Iterator[TextUnit]:
         for slide_idx, slide in enumerate(self.presentation.slides):
-            slide_prefix = f"slide{slide_idx}"
-            for shape_idx, shape in enumerate(slide.shapes):
-                base_prefix = f"{slide_prefix}.shape{shape_idx}"
-                location = f"Slide {slide_idx + 1}, shape {shape_idx + 1}"
-                if getattr(shape, "has_text_frame", False):
-                    units.extend(
-                        self._extract_text_frame(
-                            shape.text_frame,
-                            unit_prefix=f"{base_prefix}.tf",
-                            location=location,
-                        )
-                    )
-                if getattr(shape, "has_table", False):
-                    units.extend(
-                        self._extract_table(
-                            shape.table,
-                            unit_prefix=f"{base_prefix}.table",
-                            base_location=location,
-                        )
-                    )
-        return units
+            yield from self._extract_one_slide(slide_idx, slide)
+
+    def _extract_one_slide(self, slide_idx: int, slide) -> Iterator[TextUnit]:
+        slide_prefix = f"slide{slide_idx}"
+        for shape_idx, shape in enumerate(slide.shapes):
+            base_prefix = f"{slide_prefix}.shape{shape_idx}"
+            location = f"Slide {slide_idx + 1}, shape {shape_idx + 1}"
+            if shape.has_text_frame:
+                yield from self._extract_text_frame(
+                    shape.text_frame,
+                    unit_prefix=f"{base_prefix}.tf",
+                    location=location,
+                )
+            if shape.has_table:
+                yield from self._extract_table(
+                    shape.table,
+                    unit_prefix=f"{base_prefix}.table",
+                    base_location=location,
+                )
 
-    def _extract_notes(self) -> List[TextUnit]:
-        units: List[TextUnit] = []
+    def _extract_notes(self) -> Iterator[TextUnit]:
         for slide_idx, slide in enumerate(self.presentation.slides):
-            if not getattr(slide, "has_notes_slide", False):
+            if not slide.has_notes_slide:
                 continue
-            notes_slide = slide.notes_slide
-            location_base = f"Slide {slide_idx + 1} notes"
-            text_frame = notes_slide.notes_text_frame
-            if text_frame is not None:
-                units.extend(
-                    self._extract_text_frame(
-                        text_frame,
-                        unit_prefix=f"slide{slide_idx}.notes",
-                        location=location_base,
-                    )
+            yield from self._extract_one_slide_notes(slide_idx, slide.notes_slide)
+
+    def _extract_one_slide_notes(self, slide_idx: int, notes_slide) -> Iterator[TextUnit]:
+        location_base = f"Slide {slide_idx + 1} notes"
+        text_frame = notes_slide.notes_text_frame
+        if text_frame is not None:
+            yield from self._extract_text_frame(
+                text_frame,
+                unit_prefix=f"slide{slide_idx}.notes",
+                location=location_base,
+            )
+        for shape_idx, shape in enumerate(notes_slide.shapes):
+            if shape.has_text_frame:
+                yield from self._extract_text_frame(
+                    shape.text_frame,
+                    unit_prefix=f"slide{slide_idx}.notes.shape{shape_idx}",
+                    location=f"{location_base}, shape {shape_idx + 1}",
+                )
+            if shape.has_table:
+                yield from self._extract_table(
+                    shape.table,
+                    unit_prefix=f"slide{slide_idx}.notes.shape{shape_idx}.table",
+                    base_location=f"{location_base}, table {shape_idx + 1}",
                 )
-            for shape_idx, shape in enumerate(notes_slide.shapes):
-                if getattr(shape, "has_text_frame", False):
-                    units.extend(
-                        self._extract_text_frame(
-                            shape.text_frame,
-                            unit_prefix=f"slide{slide_idx}.notes.shape{shape_idx}",
-                            location=f"{location_base}, shape {shape_idx + 1}",
-                        )
-                    )
-                if getattr(shape, "has_table", False):
-                    units.extend(
-                        self._extract_table(
-                            shape.table,
-                            unit_prefix=f"slide{slide_idx}.notes.shape{shape_idx}.table",
-                            base_location=f"{location_base}, table {shape_idx + 1}",
-                        )
-                    )
-        return units
 
     def _extract_text_frame(
         self,
@@ -365,18 +470,14 @@ class PptxDocumentHandler(BaseDocumentHandler):
         *,
         unit_prefix: str,
         location: str,
-    ) -> List[TextUnit]:
-        units: List[TextUnit] = []
+    ) -> Iterator[TextUnit]:
+        prefix_dot = unit_prefix + ".p"
         for p_idx, paragraph in enumerate(text_frame.paragraphs):
-            paragraph_prefix = f"{unit_prefix}.p{p_idx}"
-            units.extend(
-                _build_units_from_runs(
-                    paragraph.runs,
-                    unit_prefix=paragraph_prefix,
-                    location=location,
-                )
+            yield from _build_units_from_runs(
+                paragraph.runs,
+                unit_prefix=prefix_dot + str(p_idx),
+                location=location,
             )
-        return units
 
     def _extract_table(
         self,
@@ -384,8 +485,7 @@ class PptxDocumentHandler(BaseDocumentHandler):
         *,
         unit_prefix: str,
         base_location: str,
-    ) -> List[TextUnit]:
-        units: List[TextUnit] = []
+    ) -> Iterator[TextUnit]:
         for r_idx, row in enumerate(table.rows):
             for c_idx, cell in enumerate(row.cells):
                 location = (
@@ -394,26 +494,27 @@ class PptxDocumentHandler(BaseDocumentHandler):
                 prefix = f"{unit_prefix}.row{r_idx}.cell{c_idx}"
                 if cell.text_frame is None:
                     continue
-                units.extend(
-                    self._extract_text_frame(
-                        cell.text_frame,
-                        unit_prefix=prefix,
-                        location=location,
-                    )
+                yield from self._extract_text_frame(
+                    cell.text_frame,
+                    unit_prefix=prefix,
+                    location=location,
                 )
-        return units
+
+
+# Lower-cased file suffix -> (document type, handler class).
+_HANDLER_BY_SUFFIX: Dict[str, Tuple[str, type[BaseDocumentHandler]]] = {
+    ".docx": ("docx", DocxDocumentHandler),
+    ".pptx": ("pptx", PptxDocumentHandler),
+}
 
 
 def detect_handler(path: pathlib.Path) -> Tuple[str, BaseDocumentHandler]:
     """Select an appropriate handler for the provided file."""
 
-    suffix = path.suffix.lower()
-    if suffix == ".docx":
-        handler: BaseDocumentHandler = DocxDocumentHandler(path)
-        return "docx", handler
-    if suffix == ".pptx":
-        handler = PptxDocumentHandler(path)
-        return "pptx", handler
-    raise UnsupportedFileTypeError(
-        "This file type isn’t supported — please use .docx or .pptx."
-    )
+    entry = _HANDLER_BY_SUFFIX.get(path.suffix.lower())
+    if entry is None:
+        raise UnsupportedFileTypeError(
+            "This file type isn’t supported — please use .docx or .pptx."
+        )
+    document_type, handler_cls = entry
+    return document_type, handler_cls(path)
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import Optional
+from typing import Dict, Optional
 
 
 class ErrorCategory(Enum):
@@ -44,10 +44,34 @@ class TranslationProviderConfigurationError(WormholeError):
 
 
 class TranslationProviderError(WormholeError):
-    """Raised when the translation provider fails permanently."""
+    """Raised when the translation provider fails permanently.
 
+    ``retry_after`` carries the delay in seconds the service asked for
+    (e.g. a ``Retry-After`` header on a rate-limit response), if any.
+    ``partial`` maps segment ids to translations obtained before the
+    failure, so callers only need to retry the rest.
+    """
 
-@dataclass
+    def __init__(
+        self,
+        *args: object,
+        retry_after: Optional[float] = None,
+        partial: Optional[Dict[str, str]] = None,
+    ) -> None:
+        super().__init__(*args)
+        self.retry_after = retry_after
+        self.partial: Dict[str, str] = partial or {}
+
+
+class TranslationServiceUnavailableError(TranslationProviderError):
+    """Raised when the service rate-limited a call, failed, or could not be reached.
+
+    Unlike a malformed response, this says nothing about the batch itself,
+    so the same request may succeed once the service recovers.
+    """
+
+
+@dataclass(slots=True, frozen=True)
 class ErrorRecord:
     """Stores context for a handled error."""
 
@@ -70,12 +94,9 @@ class ErrorTracker:
     def register(self, category: ErrorCategory) -> tuple[int, int, bool]:
         """Register a new error and return counters."""
 
-        if self.last_category == category:
-            self.consecutive += 1
-        else:
-            self.last_category = category
-            self.consecutive = 1
-
+        same = self.last_category is category
+        self.consecutive = (self.consecutive if same else 0) + 1
+        self.last_category = category
         self.total += 1
 
         threshold_reached = (
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import queue
 import threading
 from typing import Any, Callable, Optional
 
@@ -11,13 +12,50 @@ from tkinter import filedialog, messagebox, ttk
 from .translator import TranslationSummary
 
 
-TranslationExecutor = Callable[..., tuple[int, Optional[TranslationSummary], Optional[str]]]
+TranslationResult = tuple[int, Optional[TranslationSummary], Optional[str]]
+TranslationExecutor = Callable[..., TranslationResult]
 SummaryPrinter = Callable[[TranslationSummary], None]
 
+BATCH_VALIDATION_DELAY_MS = 150
+RESULT_POLL_INTERVAL_MS = 50
+
+DOCUMENT_FILETYPES = (
+    ("Word documents", "*.docx"),
+    ("PowerPoint presentations", "*.pptx"),
+    ("All files", "*.*"),
+)
+
 
 class WormholeGUI:
     """Encapsulates the Tkinter UI and translation workflow."""
 
+    __slots__ = (
+        "root",
+        "args",
+        "translation_executor",
+        "summary_printer",
+        "provider_debug",
+        "exit_code",
+        "translation_in_progress",
+        "_has_finished",
+        "_pending_validate",
+        "_batch_guidance_value",
+        "_results",
+        "_getvar",
+        "input_path_var",
+        "output_path_var",
+        "target_language_var",
+        "source_language_var",
+        "provider_var",
+        "model_var",
+        "batch_guidance_var",
+        "force_var",
+        "non_interactive_var",
+        "status_var",
+        "verbose_flag",
+        "start_button",
+    )
+
     def __init__(
         self,
         *,
@@ -36,39 +74,51 @@ class WormholeGUI:
         self.exit_code: int = 0
         self.translation_in_progress = False
         self._has_finished = False
+        self._pending_validate: Optional[str] = None
+        self._batch_guidance_value: Optional[int] = None
+        # Worker threads never touch Tk directly; results are handed over here
+        # and drained on the UI thread.
+        self._results: queue.Queue[TranslationResult] = queue.Queue()
 
         self._build_variables()
-        self._build_ui()
+        # Lay out widgets once the event loop is running so the window
+        # appears without waiting on the full widget tree.
+        self.root.after_idle(self._build_ui)
 
         self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
     def _build_variables(self) -> None:
         """Initialise Tkinter control variables from CLI arguments."""
 
-        self.input_path_var = tk.StringVar(value=getattr(self.args, "input_file", "") or "")
-        self.output_path_var = tk.StringVar(value=getattr(self.args, "output", "") or "")
-        self.target_language_var = tk.StringVar(
-            value=getattr(self.args, "target_language", "") or ""
-        )
-        self.source_language_var = tk.StringVar(
-            value=getattr(self.args, "source_language", "") or ""
-        )
-        self.provider_var = tk.StringVar(value=getattr(self.args, "provider", "") or "")
-        self.model_var = tk.StringVar(value=getattr(self.args, "model", "") or "")
+        values = vars(self.args) if hasattr(self.args, "__dict__") else {}
 
-        batch_guidance = getattr(self.args, "batch_guidance", 2000) or 2000
+        self.input_path_var = tk.StringVar(value=values.get("input_file") or "")
+        self.output_path_var = tk.StringVar(value=values.get("output") or "")
+        self.target_language_var = tk.StringVar(value=values.get("target_language") or "")
+        self.source_language_var = tk.StringVar(value=values.get("source_language") or "")
+        self.provider_var = tk.StringVar(value=values.get("provider") or "")
+        self.model_var = tk.StringVar(value=values.get("model") or "")
+
+        batch_guidance = values.get("batch_guidance") or 2000
         self.batch_guidance_var = tk.StringVar(value=str(batch_guidance))
+        self._validate_batch_guidance()
+        self.batch_guidance_var.trace_add("write", self._schedule_batch_validation)
 
-        self.force_var = tk.BooleanVar(value=bool(getattr(self.args, "force", False)))
-        self.non_interactive_var = tk.BooleanVar(
-            value=bool(getattr(self.args, "non_interactive", False))
-        )
+        self.force_var = tk.BooleanVar(value=bool(values.get("force")))
+        self.non_interactive_var = tk.BooleanVar(value=bool(values.get("non_interactive")))
 
         self.status_var = tk.StringVar(
             value="Select your document, choose a target language, then run the translation."
         )
 
-        self.verbose_flag = bool(getattr(self.args, "verbose", False))
+        self.verbose_flag = bool(values.get("verbose"))
+        self._getvar = self.root.tk.globalgetvar
+
+    def _read_text(self, variable: tk.StringVar) -> str:
+        """Read a string variable straight from Tcl, stripped of whitespace."""
+
+        value = self._getvar(str(variable))
+        return (value if isinstance(value, str) else str(value)).strip()
 
     def _build_ui(self) -> None:
         """Construct the Tkinter layout."""
@@ -169,11 +219,7 @@ class WormholeGUI:
 
         selection = filedialog.askopenfilename(
             title="Select a document",
-            filetypes=[
-                ("Word documents", "*.docx"),
-                ("PowerPoint presentations", "*.pptx"),
-                ("All files", "*.*"),
-            ],
+            filetypes=DOCUMENT_FILETYPES,
         )
         if selection:
             self.input_path_var.set(selection)
@@ -183,16 +229,31 @@ class WormholeGUI:
 
         selection = filedialog.asksaveasfilename(
             title="Save translated document as",
-            filetypes=[
-                ("Word documents", "*.docx"),
-                ("PowerPoint presentations", "*.pptx"),
-                ("All files", "*.*"),
-            ],
+            filetypes=DOCUMENT_FILETYPES,
             defaultextension=".docx",
         )
         if selection:
             self.output_path_var.set(selection)
 
+    def _schedule_batch_validation(self, *_: Any) -> None:
+        """Re-parse batch guidance once typing pauses rather than on every keystroke."""
+
+        if self._pending_validate is not None:
+            self.root.after_cancel(self._pending_validate)
+        self._pending_validate = self.root.after(
+            BATCH_VALIDATION_DELAY_MS, self._validate_batch_guidance
+        )
+
+    def _validate_batch_guidance(self) -> None:
+        """Cache the batch guidance as a positive integer, or ``None`` if invalid."""
+
+        self._pending_validate = None
+        try:
+            value = int(self.batch_guidance_var.get())
+        except ValueError:
+            value = 0
+        self._batch_guidance_value = value if value > 0 else None
+
     def _on_start_event(self, event: Any) -> None:
         """Handle Return/Enter key presses."""
 
@@ -204,8 +265,8 @@ class WormholeGUI:
         if self.translation_in_progress:
             return
 
-        input_path = self.input_path_var.get().strip()
-        target_language = self.target_language_var.get().strip()
+        input_path = self._read_text(self.input_path_var)
+        target_language = self._read_text(self.target_language_var)
         if not input_path:
             messagebox.showerror("Wormhole", "Please choose an input .docx or .pptx file.")
             return
@@ -213,21 +274,22 @@ class WormholeGUI:
             messagebox.showerror("Wormhole", "Please provide a target language.")
             return
 
-        try:
-            batch_guidance = int(self.batch_guidance_var.get())
-            if batch_guidance <= 0:
-                raise ValueError
-        except ValueError:
+        if self._pending_validate is not None:
+            # The user started before the debounce fired; validate now.
+            self.root.after_cancel(self._pending_validate)
+            self._validate_batch_guidance()
+        batch_guidance = self._batch_guidance_value
+        if batch_guidance is None:
             messagebox.showerror(
                 "Wormhole",
                 "Batch guidance must be a positive integer number of characters.",
             )
             return
 
-        output_path = self.output_path_var.get().strip() or None
-        source_language = self.source_language_var.get().strip() or None
-        provider = self.provider_var.get().strip() or None
-        model = self.model_var.get().strip() or None
+        output_path = self._read_text(self.output_path_var) or None
+        source_language = self._read_text(self.source_language_var) or None
+        provider = self._read_text(self.provider_var) or None
+        model = self._read_text(self.model_var) or None
 
         self.translation_in_progress = True
         self.status_var.set("Running translation — please wait.")
@@ -252,18 +314,22 @@ class WormholeGUI:
             args=(config,),
             daemon=True,
         ).start()
+        self.root.after(RESULT_POLL_INTERVAL_MS, self._drain_results)
 
     def _execute_translation(self, config: dict[str, Any]) -> None:
         """Invoke the translation executor in a worker thread."""
 
-        exit_code, summary, message = self.translation_executor(**config)
-        self.root.after(
-            0,
-            self._handle_result,
-            exit_code,
-            summary,
-            message,
-        )
+        self._results.put(self.translation_executor(**config))
+
+    def _drain_results(self) -> None:
+        """Poll for the worker's result on the UI thread."""
+
+        try:
+            exit_code, summary, message = self._results.get_nowait()
+        except queue.Empty:
+            self.root.after(RESULT_POLL_INTERVAL_MS, self._drain_results)
+            return
+        self._handle_result(exit_code, summary, message)
 
     def _handle_result(
         self,
@@ -16,6 +16,15 @@ from .errors import (
 class ErrorPolicy:
     """Implements the resilient error policy described in the specification."""
 
+    _RESPONSES = {
+        "c": "continue",
+        "continue": "continue",
+        "r": "retry",
+        "retry": "retry",
+        "a": "abort",
+        "abort": "abort",
+    }
+
     def __init__(self, *, interactive: bool) -> None:
         self.interactive = interactive
         self.records: List[ErrorRecord] = []
@@ -34,7 +43,8 @@ class ErrorPolicy:
     ) -> str:
         """Handle an error and decide whether to continue, retry, or abort."""
 
-        self.records.append(ErrorRecord(category=category, message=message, details=details))
+        # Records are kept for every error: the run summary reports them all.
+        self.records.append(ErrorRecord(category, message, details))
         consecutive, total, threshold = self.tracker.register(category)
 
         print(message)
@@ -53,12 +63,11 @@ class ErrorPolicy:
                 "Error threshold exceeded in non-interactive mode. Stopping safely."
             )
 
+        prompt_line = f"{prompt} "
         while True:
-            response = input(f"{prompt} ").strip().lower()
-            if response in {"continue", "c"}:
-                return "continue"
-            if response in {"retry", "r"}:
-                return "retry"
-            if response in {"abort", "a"}:
+            response = self._RESPONSES.get(input(prompt_line).strip().lower())
+            if response == "abort":
                 raise AbortRequested("Abort requested by user.")
+            if response:
+                return response
             print("Please respond with Continue, Retry, or Abort (c/r/a).")
@@ -2,22 +2,369 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import importlib.util
 import json
 import os
+import re
+import sqlite3
 import sys
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Sequence
+from dataclasses import dataclass
+from operator import attrgetter, itemgetter
+from typing import Any, Dict, List, Sequence
+
+try:  # Optional: a faster JSON codec when it happens to be installed.
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
 from .errors import (
     TranslationProviderConfigurationError,
     TranslationProviderError,
+    TranslationServiceUnavailableError,
 )
 from .structures import TextSegment
+from .tm_cache import TranslationMemory, open_translation_memory
+
+
+_PROVIDER_SYNONYMS = {"azure_open_ai": "azure_openai", "azure-openai": "azure_openai"}
+_VALID_PROVIDERS = frozenset(("openai", "azure_openai"))
+_AZURE_REQUIRED = (
+    "AZURE_OPENAI_API_KEY",
+    "AZURE_OPENAI_ENDPOINT",
+    "AZURE_OPENAI_API_VERSION",
+    "AZURE_OPENAI_DEPLOYMENT_NAME",
+)
+# Connection pool shared by every request a provider issues; HTTP/2 is used
+# when the optional ``h2`` package is installed.
+_HTTP_POOL_LIMITS = {"max_connections": 64, "max_keepalive_connections": 32}
+_HTTP_TIMEOUT_SECONDS = 600.0
+_HTTP_CONNECT_TIMEOUT_SECONDS = 5.0
+_HTTP_CONNECT_RETRIES = 2
+_STREAM_ENV_NAME = "WORMHOLE_STREAM_RESPONSES"
+# Batch API polling: start at a few seconds and back off to once a minute.
+_BATCH_POLL_INITIAL_SECONDS = 5.0
+_BATCH_POLL_MAX_SECONDS = 60.0
+
+# Kept byte-identical across requests (and sent first) so the provider's
+# prompt-prefix cache can reuse it; per-batch data goes in the user message.
+SYSTEM_PROMPT = (
+    "You are a professional translator. Return only JSON. "
+    "Translate the provided text segments into the requested language. "
+    "Preserve formatting, placeholders, numbers, and markup. "
+    "Respond strictly with an object shaped as "
+    '{"translations": [{"id": "...", "translated": "..."}]}. '
+    "Input may include tags such as <run id=\"…\">…</run>; keep tags and their "
+    "attributes exactly as provided, translate only the inner text, and you may "
+    "redistribute translated words across sequential runs as needed while "
+    "preserving tag order. "
+    "Do not add commentary. Do not wrap the JSON in markdown code fences."
+)
+
+# Structured Outputs schema for the Responses API: the model is constrained to
+# emit exactly the shape the parser expects.
+_TRANSLATIONS_FORMAT = {
+    "type": "json_schema",
+    "name": "wormhole_translations",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {
+            "translations": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "id": {"type": "string"},
+                        "translated": {"type": "string"},
+                    },
+                    "required": ["id", "translated"],
+                    "additionalProperties": False,
+                },
+            },
+        },
+        "required": ["translations"],
+        "additionalProperties": False,
+    },
+}
+_BATCH_TERMINAL_STATUSES = frozenset(("completed", "failed", "expired", "cancelled"))
+_TRUTHY = frozenset(("1", "true", "yes", "on"))
+_JSON_DECODER = json.JSONDecoder()
+_JSON_COMPACT = (",", ":")
+_FENCE_OPEN = re.compile(r"\s*```[^\n]*\n(?=\s*\S)")
+_ID_AND_TRANSLATION = itemgetter("id", "translated")
+# Prefix of the synthetic ids used for de-duplicated request texts.
+_UNIQUE_ID_PREFIX = "u"
+# Text without any letters (digits, punctuation, symbols, whitespace only).
+_NOTHING_TO_TRANSLATE = re.compile(r"[\W\d_]*")
+_SEGMENT_ID = attrgetter("segment_id")
+_SEGMENT_TEXT = attrgetter("text")
+# Plain output text parts carry no JSON payload, so their text can be read
+# without the generic attribute walk.
+_PART_TYPE_AND_TEXT = attrgetter("type", "text")
+_TEXT_PART_TYPES = frozenset(("output_text", "text"))
+_JSON_SEPARATORS = frozenset(" \t\r\n,")
+
+
+def _build_http_client(*, asynchronous: bool = False) -> Any:
+    """Return a persistent httpx client for the OpenAI SDK, or ``None``.
+
+    ``httpx`` ships with the OpenAI SDK; if it is somehow unavailable the SDK
+    falls back to its own default transport.
+    """
+
+    try:
+        import httpx  # type: ignore
+    except ImportError:  # pragma: no cover - import guard
+        return None
+
+    http2 = importlib.util.find_spec("h2") is not None
+    limits = httpx.Limits(**_HTTP_POOL_LIMITS)
+    timeout = httpx.Timeout(
+        _HTTP_TIMEOUT_SECONDS, connect=_HTTP_CONNECT_TIMEOUT_SECONDS
+    )
+    if asynchronous:
+        return httpx.AsyncClient(
+            http2=http2,
+            limits=limits,
+            timeout=timeout,
+            transport=httpx.AsyncHTTPTransport(
+                http2=http2, limits=limits, retries=_HTTP_CONNECT_RETRIES
+            ),
+        )
+    return httpx.Client(
+        http2=http2,
+        limits=limits,
+        timeout=timeout,
+        transport=httpx.HTTPTransport(
+            http2=http2, limits=limits, retries=_HTTP_CONNECT_RETRIES
+        ),
+    )
+
+
+_shared_http_client: Any = None
+_shared_http_lock = threading.Lock()
+
+
+def _get_shared_http_client() -> Any:
+    """Return the process-wide sync httpx client, creating it on first use.
+
+    Every sync SDK client (OpenAI, Azure, legacy) shares this pool so TLS
+    connections survive across providers and runs. Async clients keep their
+    own pool because httpx async connections are bound to one event loop.
+    """
+
+    global _shared_http_client
+    with _shared_http_lock:
+        if _shared_http_client is None:
+            _shared_http_client = _build_http_client()
+        return _shared_http_client
+
+
+def _http_client_for(*, asynchronous: bool) -> Any:
+    if asynchronous:
+        return _build_http_client(asynchronous=True)
+    return _get_shared_http_client()
+
+
+def _dumps_compact(value: Any) -> str:
+    """Encode JSON compactly without ASCII escaping."""
+
+    if orjson is not None:
+        try:
+            return orjson.dumps(value).decode("utf-8")
+        except TypeError:  # e.g. lone surrogates; let the stdlib handle them
+            pass
+    return json.dumps(value, ensure_ascii=False, separators=_JSON_COMPACT)
+
+
+@functools.lru_cache(maxsize=4)
+def _responses_system_message(system_prompt: str) -> dict[str, Any]:
+    """Responses API system message; built once per prompt and shared (read-only)."""
+
+    return {
+        "role": "system",
+        "content": [
+            {"type": "input_text", "text": system_prompt},
+        ],
+    }
+
+
+@functools.lru_cache(maxsize=4)
+def _chat_system_message(system_prompt: str) -> dict[str, Any]:
+    """Chat Completions system message; built once per prompt and shared (read-only)."""
+
+    return {"role": "system", "content": system_prompt}
+
+
+def _retry_after_seconds(exc: BaseException) -> float | None:
+    """Return the retry delay an SDK error's HTTP response asked for, if any."""
+
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if headers is None:
+        return None
+    try:
+        milliseconds = headers.get("retry-after-ms")
+        if milliseconds is not None:
+            return max(0.0, float(milliseconds) / 1000)
+        seconds = headers.get("retry-after")
+        if seconds is not None:
+            return max(0.0, float(seconds))
+    except (TypeError, ValueError):
+        # HTTP-date values are rare for these APIs; fall back to backoff.
+        pass
+    return None
+
+
+class _StreamInterrupted(TranslationServiceUnavailableError):
+    """A streamed response failed after some translations had arrived."""
+
+    def __init__(
+        self, *args: object, items: List[Any], retry_after: float | None
+    ) -> None:
+        super().__init__(*args, retry_after=retry_after)
+        self.items = items
+
+
+def _is_transient(exc: BaseException) -> bool:
+    """Return whether an SDK error is a rate limit, server error or lost connection."""
+
+    status = getattr(exc, "status_code", None)
+    if isinstance(status, int):
+        return status in (408, 429) or status >= 500
+    connection_errors: tuple[type[BaseException], ...] = (ConnectionError, TimeoutError)
+    # Both SDKs are imported by the time a request can fail.
+    openai = sys.modules.get("openai")
+    if openai is not None:
+        connection_errors += (openai.APIConnectionError,)
+    httpx = sys.modules.get("httpx")
+    if httpx is not None:
+        connection_errors += (httpx.TransportError,)
+    return isinstance(exc, connection_errors)
+
+
+def _service_unavailable(
+    exc: BaseException, *, items: List[Any] | None = None
+) -> TranslationProviderError:
+    """Wrap an SDK error; only transient ones count as the service being unavailable.
+
+    A request the service rejected (e.g. a 400 for an oversized batch)
+    would fail the same way again, so it stays a plain provider error.
+    A stream that broke after translations had arrived was accepted and
+    is treated as a lost connection.
+    """
+
+    retry_after = _retry_after_seconds(exc)
+    if items:
+        return _StreamInterrupted(
+            f"Translation service temporarily unavailable — {exc}",
+            items=list(items),
+            retry_after=retry_after,
+        )
+    if _is_transient(exc):
+        return TranslationServiceUnavailableError(
+            f"Translation service temporarily unavailable — {exc}",
+            retry_after=retry_after,
+        )
+    return TranslationProviderError(
+        f"Translation request rejected — {exc}", retry_after=retry_after
+    )
+
+
+def _loads(text: str) -> Any:
+    """Decode JSON; raises ``json.JSONDecodeError`` on invalid input."""
+
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+class _TranslationStreamParser:
+    """Incrementally decode translation objects from streamed JSON text.
+
+    Each ``{"id": ..., "translated": ...}`` object is decoded as soon as its
+    closing brace arrives. The parser only understands the two shapes the
+    prompt asks for (an object with a ``translations`` list, or a bare list);
+    ``complete`` stays false for anything else so callers can fall back to
+    parsing the full text.
+    """
+
+    def __init__(self) -> None:
+        self.items: List[Any] = []
+        self.complete = False
+        self.failed = False
+        self._buffer = ""
+        self._in_array = False
+
+    def feed(self, text: str) -> None:
+        if self.complete or self.failed:
+            return
+        buffer = self._buffer + text
+        pos = 0
+        if not self._in_array:
+            pos = self._find_array_start(buffer)
+            if pos < 0:
+                self._buffer = buffer
+                return
+            self._in_array = True
+
+        length = len(buffer)
+        while True:
+            while pos < length and buffer[pos] in _JSON_SEPARATORS:
+                pos += 1
+            if pos >= length:
+                break
+            if buffer[pos] == "]":
+                self.complete = True
+                break
+            if buffer[pos] != "{":
+                self.failed = True
+                break
+            try:
+                item, pos = _JSON_DECODER.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                break  # object not complete yet
+            self.items.append(item)
+        self._buffer = buffer[pos:]
+
+    def _find_array_start(self, buffer: str) -> int:
+        """Return the index just past the translations ``[``, or -1 if unseen."""
+
+        start = buffer.find("{")
+        bracket = buffer.find("[")
+        if bracket >= 0 and (start < 0 or bracket < start):
+            return bracket + 1
+        if start < 0:
+            return -1
+        key = buffer.find('"translations"', start)
+        if key < 0:
+            return -1
+        bracket = buffer.find("[", key)
+        return bracket + 1 if bracket >= 0 else -1
+
+
+@dataclass(slots=True)
+class PreparedBatch:
+    """A batch's request arguments plus any provider-built payload."""
+
+    segments: Sequence[TextSegment]
+    source_language: str | None
+    target_language: str
+    model: str | None
+    payload: Any = None
 
 
 class TranslationProvider(ABC):
     """Abstract adapter for translation providers."""
 
+    # True when ``atranslate`` uses a native async client rather than a
+    # worker thread; the runner then dispatches batches on an event loop.
+    NATIVE_ASYNC = False
+
     @abstractmethod
     def translate(
         self,
@@ -29,6 +376,76 @@ class TranslationProvider(ABC):
     ) -> Dict[str, str]:
         """Translate the provided segments and return a mapping by segment id."""
 
+    def close(self) -> None:
+        """Release any per-run resources held by the provider."""
+
+    def prepare(
+        self,
+        segments: Sequence[TextSegment],
+        *,
+        source_language: str | None,
+        target_language: str,
+        model: str | None = None,
+    ) -> PreparedBatch:
+        """Do the request work that does not depend on the call succeeding.
+
+        The result can be passed to ``translate_prepared`` any number of
+        times, so retries skip re-encoding. The default keeps the arguments
+        only; providers that build a payload override this.
+        """
+
+        return PreparedBatch(
+            segments=segments,
+            source_language=source_language,
+            target_language=target_language,
+            model=model,
+        )
+
+    def translate_prepared(self, prepared: PreparedBatch) -> Dict[str, str]:
+        """Translate a batch returned by ``prepare``."""
+
+        return self.translate(
+            prepared.segments,
+            source_language=prepared.source_language,
+            target_language=prepared.target_language,
+            model=prepared.model,
+        )
+
+    async def atranslate_prepared(self, prepared: PreparedBatch) -> Dict[str, str]:
+        """Asynchronously translate a batch returned by ``prepare``."""
+
+        return await self.atranslate(
+            prepared.segments,
+            source_language=prepared.source_language,
+            target_language=prepared.target_language,
+            model=prepared.model,
+        )
+
+    async def aclose(self) -> None:
+        """Release resources bound to the running event loop."""
+
+    async def atranslate(
+        self,
+        segments: Sequence[TextSegment],
+        *,
+        source_language: str | None,
+        target_language: str,
+        model: str | None = None,
+    ) -> Dict[str, str]:
+        """Asynchronously translate one batch of segments.
+
+        The default runs ``translate`` in a worker thread; providers with a
+        native async client override this.
+        """
+
+        return await asyncio.to_thread(
+            self.translate,
+            segments,
+            source_language=source_language,
+            target_language=target_language,
+            model=model,
+        )
+
 
 class EchoTranslationProvider(TranslationProvider):
     """A provider that returns the original text (useful for testing)."""
@@ -41,33 +458,107 @@ class EchoTranslationProvider(TranslationProvider):
         target_language: str,
         model: str | None = None,
     ) -> Dict[str, str]:
-        return {segment.segment_id: segment.text for segment in segments}
+        return dict(zip(map(_SEGMENT_ID, segments), map(_SEGMENT_TEXT, segments)))
 
 
 class OpenAITranslationProvider(TranslationProvider):
     """Translation provider that uses OpenAI chat models."""
 
     DEFAULT_MODEL = "gpt-5-mini"  # "gpt-4o-mini"
+    BATCH_ENDPOINT = "/v1/responses"
+    NATIVE_ASYNC = True
 
-    def __init__(self, *, debug: bool = False) -> None:
+    def __init__(
+        self,
+        *,
+        debug: bool = False,
+        stream: bool | None = None,
+    ) -> None:
         self.debug = debug
+        if stream is None:
+            stream = os.getenv(_STREAM_ENV_NAME, "").strip().lower() in _TRUTHY
+        self.stream = stream
         provider_value = os.getenv("LLM_PROVIDER", "openai") or "openai"
         normalized = provider_value.strip().lower()
-        if normalized in {"azure_open_ai", "azure-openai"}:
-            normalized = "azure_openai"
-        if normalized not in {"openai", "azure_openai"}:
+        normalized = _PROVIDER_SYNONYMS.get(normalized, normalized)
+        if normalized not in _VALID_PROVIDERS:
             normalized = "openai"
 
         self.provider_kind = normalized
-        self._client, self._default_model = self._build_client()
+        # The SDK client (and the ``openai`` import behind it) is built on
+        # first use; see ``_get_client``.
+        self._client: Any = None
+        self._default_model_name: str | None = None
+        self._async_client: Any = None
+        # Batches may be dispatched from several threads at once.
+        self._client_lock = threading.Lock()
+        try:
+            self._memory: TranslationMemory | None = open_translation_memory()
+        except (OSError, sqlite3.Error) as exc:
+            raise TranslationProviderConfigurationError(
+                f"Translation memory cache could not be opened — {exc}"
+            ) from exc
 
-    def _build_client(self) -> tuple[Any, str]:
+    def _build_client(self, *, asynchronous: bool = False) -> tuple[Any, str]:
         if self.provider_kind == "azure_openai":
-            return self._build_azure_client()
+            return self._build_azure_client(asynchronous=asynchronous)
+
+        return self._build_openai_client(asynchronous=asynchronous)
 
-        return self._build_openai_client()
+    def _get_client(self) -> Any:
+        """Return the SDK client, building it on first use or after ``close``."""
 
-    def _build_openai_client(self) -> tuple[Any, str]:
+        client = self._client
+        if client is None:
+            with self._client_lock:
+                client = self._client
+                if client is None:
+                    client, self._default_model_name = self._build_client()
+                    self._client = client
+        return client
+
+    @property
+    def _default_model(self) -> str:
+        """Model (or Azure deployment) used when callers do not pick one.
+
+        Read from the configuration, so the async path does not build a
+        sync client just to learn the name.
+        """
+
+        if self._default_model_name is None:
+            if self.provider_kind == "azure_openai":
+                self._default_model_name = self._azure_settings()[3]
+            else:
+                self._default_model_name = self.DEFAULT_MODEL
+        return self._default_model_name
+
+    def _get_async_client(self) -> Any:
+        """Return the async SDK client, constructing it on first use."""
+
+        if self._async_client is None:
+            self._async_client, _ = self._build_client(asynchronous=True)
+        return self._async_client
+
+    def close(self) -> None:
+        """Drop the SDK clients; the next request builds fresh ones.
+
+        The sync client's connection pool is shared process-wide and stays
+        open for other providers.
+        """
+
+        self._client = None
+        # The async client can only be closed from an event loop; callers of
+        # the async API are expected to await ``aclose`` instead.
+        self._async_client = None
+
+    async def aclose(self) -> None:
+        """Release the pooled connections held by the async SDK client."""
+
+        client, self._async_client = self._async_client, None
+        if client is not None:
+            await client.close()
+
+    def _build_openai_client(self, *, asynchronous: bool = False) -> tuple[Any, str]:
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
             raise TranslationProviderConfigurationError(
@@ -75,50 +566,51 @@ class OpenAITranslationProvider(TranslationProvider):
                 "different provider."
             )
         try:
-            from openai import OpenAI  # type: ignore
+            from openai import AsyncOpenAI, OpenAI  # type: ignore
         except ImportError as exc:  # pragma: no cover - import guard
             raise TranslationProviderConfigurationError(
                 "OpenAI Python SDK not installed. Install with `pip install openai`."
             ) from exc
 
-        return OpenAI(api_key=api_key), self.DEFAULT_MODEL
-
-    def _build_azure_client(self) -> tuple[Any, str]:
-        api_key = os.getenv("AZURE_OPENAI_API_KEY")
-        endpoint = os.getenv("AZURE_OPENAI_ENDPOINT")
-        api_version = os.getenv("AZURE_OPENAI_API_VERSION")
-        deployment_name = os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME")
-
-        missing = [
-            name
-            for name, value in {
-                "AZURE_OPENAI_API_KEY": api_key,
-                "AZURE_OPENAI_ENDPOINT": endpoint,
-                "AZURE_OPENAI_API_VERSION": api_version,
-                "AZURE_OPENAI_DEPLOYMENT_NAME": deployment_name,
-            }.items()
-            if not value
-        ]
+        client_cls = AsyncOpenAI if asynchronous else OpenAI
+        client = client_cls(
+            api_key=api_key,
+            http_client=_http_client_for(asynchronous=asynchronous),
+        )
+        return client, self.DEFAULT_MODEL
+
+    @staticmethod
+    def _azure_settings() -> tuple[str, str, str, str]:
+        """Return the API key, endpoint, API version and deployment name."""
+
+        values = tuple(os.getenv(name) for name in _AZURE_REQUIRED)
+        missing = [name for name, value in zip(_AZURE_REQUIRED, values) if not value]
         if missing:
             raise TranslationProviderConfigurationError(
                 "Azure OpenAI configuration incomplete. Please set: "
                 + ", ".join(missing)
                 + "."
             )
+        return values  # type: ignore[return-value]
+
+    def _build_azure_client(self, *, asynchronous: bool = False) -> tuple[Any, str]:
+        api_key, endpoint, api_version, deployment_name = self._azure_settings()
 
         try:
-            from openai import AzureOpenAI  # type: ignore
+            from openai import AsyncAzureOpenAI, AzureOpenAI  # type: ignore
         except ImportError as exc:  # pragma: no cover - import guard
             raise TranslationProviderConfigurationError(
                 "OpenAI Python SDK not installed. Install with `pip install openai`."
             ) from exc
 
-        client = AzureOpenAI(
+        client_cls = AsyncAzureOpenAI if asynchronous else AzureOpenAI
+        client = client_cls(
             api_key=api_key,
             api_version=api_version,
             azure_endpoint=endpoint,
+            http_client=_http_client_for(asynchronous=asynchronous),
         )
-        return client, deployment_name  # type: ignore[arg-type]
+        return client, deployment_name
 
     def translate(
         self,
@@ -130,90 +622,581 @@ class OpenAITranslationProvider(TranslationProvider):
     ) -> Dict[str, str]:
         if not segments:
             return {}
+        return self.translate_prepared(
+            self.prepare(
+                segments,
+                source_language=source_language,
+                target_language=target_language,
+                model=model,
+            )
+        )
+
+    async def atranslate(
+        self,
+        segments: Sequence[TextSegment],
+        *,
+        source_language: str | None,
+        target_language: str,
+        model: str | None = None,
+    ) -> Dict[str, str]:
+        if not segments:
+            return {}
+        return await self.atranslate_prepared(
+            self.prepare(
+                segments,
+                source_language=source_language,
+                target_language=target_language,
+                model=model,
+            )
+        )
+
+    def prepare(
+        self,
+        segments: Sequence[TextSegment],
+        *,
+        source_language: str | None,
+        target_language: str,
+        model: str | None = None,
+    ) -> PreparedBatch:
+        """Resolve translation-memory hits and encode the request once."""
+
+        model_name = model or self._default_model
+        known, misses = self._recall(
+            segments,
+            source_language=source_language,
+            target_language=target_language,
+            model=model_name,
+        )
+        request = None
+        if misses:
+            request = self._prepare_request(
+                misses,
+                source_language=source_language,
+                target_language=target_language,
+            )
+        return PreparedBatch(
+            segments=segments,
+            source_language=source_language,
+            target_language=target_language,
+            model=model_name,
+            payload=(known, misses, request),
+        )
+
+    def translate_prepared(self, prepared: PreparedBatch) -> Dict[str, str]:
+        known, misses, request = prepared.payload
+        if request is None:
+            return dict(known)
+        system_prompt, user_content, groups = request
+        try:
+            response_items = self._invoke_model(
+                system_prompt=system_prompt,
+                user_content=user_content,
+                model=prepared.model,
+            )
+        except TranslationProviderError as exc:
+            raise self._with_partial(exc, known, groups)
+        return self._merge_response(prepared, response_items)
+
+    async def atranslate_prepared(self, prepared: PreparedBatch) -> Dict[str, str]:
+        known, misses, request = prepared.payload
+        if request is None:
+            return dict(known)
+        system_prompt, user_content, groups = request
+        try:
+            response_items = await self._ainvoke_model(
+                system_prompt=system_prompt,
+                user_content=user_content,
+                model=prepared.model,
+            )
+        except TranslationProviderError as exc:
+            raise self._with_partial(exc, known, groups)
+        return self._merge_response(prepared, response_items)
+
+    def _merge_response(
+        self, prepared: PreparedBatch, response_items: list[dict[str, Any]]
+    ) -> Dict[str, str]:
+        """Map the response, remember it, and add the already-known translations."""
+
+        known, misses, (_, _, groups) = prepared.payload
+        translated = self._build_mapping(response_items, groups)
+        self._remember(
+            misses,
+            translated,
+            source_language=prepared.source_language,
+            target_language=prepared.target_language,
+            model=prepared.model,  # type: ignore[arg-type]
+        )
+        mapping = dict(known)
+        mapping.update(translated)
+        return mapping
+
+    def _with_partial(
+        self,
+        exc: TranslationProviderError,
+        known: Dict[str, str],
+        groups: List[List[str]],
+    ) -> TranslationProviderError:
+        """Attach the translations known before a failed call to ``exc``.
+
+        ``known`` holds translation-memory hits and blank segments; an
+        interrupted stream adds the objects that had fully arrived.
+        """
+
+        partial = dict(known)
+        if isinstance(exc, _StreamInterrupted):
+            try:
+                partial.update(self._build_mapping(exc.items, groups))
+            except TranslationProviderError:
+                pass  # a malformed fragment is simply retried with the rest
+        exc.partial = partial
+        return exc
+
+    def _recall(
+        self,
+        segments: Sequence[TextSegment],
+        *,
+        source_language: str | None,
+        target_language: str,
+        model: str,
+    ) -> tuple[Dict[str, str], List[TextSegment]]:
+        """Split segments into already-known translations and segments to send.
+
+        Blank segments (and a lone segment with no letters, e.g. a page
+        number) translate to themselves and are never sent; the rest are
+        looked up in the translation memory when it is enabled.
+        """
+
+        hits: Dict[str, str] = {}
+        if len(segments) == 1 and _NOTHING_TO_TRANSLATE.fullmatch(segments[0].text):
+            hits[segments[0].segment_id] = segments[0].text
+            return hits, []
+        pending: List[TextSegment] = []
+        for segment in segments:
+            if segment.text.isspace() or not segment.text:
+                hits[segment.segment_id] = segment.text
+            else:
+                pending.append(segment)
+        if self._memory is None or not pending:
+            return hits, pending
+        cached = self._memory.lookup(
+            {segment.text for segment in pending},
+            source_language=source_language,
+            target_language=target_language,
+            model=model,
+        )
+        misses: List[TextSegment] = []
+        for segment in pending:
+            translated = cached.get(segment.text)
+            if translated is None:
+                misses.append(segment)
+            else:
+                hits[segment.segment_id] = translated
+        return hits, misses
+
+    def _remember(
+        self,
+        segments: Sequence[TextSegment],
+        mapping: Dict[str, str],
+        *,
+        source_language: str | None,
+        target_language: str,
+        model: str,
+    ) -> None:
+        """Store fresh translations in the translation memory, if enabled."""
+
+        if self._memory is None:
+            return
+        self._memory.store(
+            {
+                segment.text: mapping[segment.segment_id]
+                for segment in segments
+                if segment.segment_id in mapping
+            },
+            source_language=source_language,
+            target_language=target_language,
+            model=model,
+        )
+
+    def translate_bulk(
+        self, batches: Sequence[PreparedBatch]
+    ) -> List[Dict[str, str] | BaseException]:
+        """Translate batches returned by ``prepare`` in one OpenAI Batch API job.
+
+        Batch jobs cost less and are not bound by per-request rate limits,
+        but complete asynchronously (within 24 hours), so this suits
+        offline runs. Only the segments ``prepare`` left to send are
+        uploaded, and fresh translations are remembered as for direct
+        calls. Results are aligned with ``batches``; a batch the job could
+        not translate yields a ``TranslationProviderError`` carrying the
+        translations already known.
+        """
+
+        lines = []
+        for index, prepared in enumerate(batches):
+            request = prepared.payload[2]
+            if request is None:
+                continue
+            system_prompt, user_content, _ = request
+            lines.append(
+                _dumps_compact(
+                    {
+                        "custom_id": str(index),
+                        "method": "POST",
+                        "url": self.BATCH_ENDPOINT,
+                        "body": self._request_body(
+                            system_prompt=system_prompt,
+                            user_content=user_content,
+                            model=prepared.model,  # type: ignore[arg-type]
+                        ),
+                    }
+                )
+            )
+        if not lines:
+            return [dict(prepared.payload[0]) for prepared in batches]
+
+        client = self._get_client()
+        try:
+            upload = client.files.create(
+                file=("wormhole-batch.jsonl", "\n".join(lines).encode("utf-8")),
+                purpose="batch",
+            )
+            job = client.batches.create(
+                input_file_id=upload.id,
+                endpoint=self.BATCH_ENDPOINT,
+                completion_window="24h",
+            )
+            delay = _BATCH_POLL_INITIAL_SECONDS
+            while job.status not in _BATCH_TERMINAL_STATUSES:
+                time.sleep(delay)
+                delay = min(delay * 2, _BATCH_POLL_MAX_SECONDS)
+                job = client.batches.retrieve(job.id)
+            if self.debug:
+                self._log_debug("provider.batch.job", self._safe_dump_response(job))
+            # Successful requests land in the output file, failed ones in the
+            # error file; both use the same line format.
+            output = "\n".join(
+                client.files.content(file_id).text
+                for file_id in (job.output_file_id, job.error_file_id)
+                if file_id
+            )
+        except Exception as exc:  # pragma: no cover - network call
+            raise _service_unavailable(exc) from exc
+
+        records: Dict[str, dict[str, Any]] = {}
+        for line in output.splitlines():
+            try:
+                record = _loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(record, dict) and isinstance(record.get("custom_id"), str):
+                records[record["custom_id"]] = record
+
+        results: List[Dict[str, str] | BaseException] = []
+        for index, prepared in enumerate(batches):
+            known, _, request = prepared.payload
+            if request is None:
+                results.append(dict(known))
+                continue
+            record = records.get(str(index))
+            try:
+                if record is None:
+                    raise TranslationProviderError(
+                        f"Batch job {job.id} ended with status '{job.status}' "
+                        "without a result."
+                    )
+                results.append(
+                    self._merge_response(prepared, self._parse_batch_record(record))
+                )
+            except TranslationProviderError as exc:
+                results.append(self._with_partial(exc, known, request[2]))
+        return results
+
+    def _parse_batch_record(self, record: dict[str, Any]) -> list[dict[str, Any]]:
+        """Return the translation items of one Batch API output line."""
+
+        response = record.get("response") or {}
+        body = response.get("body") or {}
+        if record.get("error") or response.get("status_code") != 200:
+            detail = record.get("error") or body.get("error") or response.get("status_code")
+            raise TranslationProviderError(f"Batch request failed — {detail}")
+        text = self._batch_body_text(body)
+        if not text:
+            raise TranslationProviderError(
+                "Translation provider response empty or unrecognised."
+            )
+        return self._normalise_translations(text)
+
+    def _batch_body_text(self, body: dict[str, Any]) -> str | None:
+        """Return the output text of a Responses Batch API result body."""
+
+        parts = [
+            part.get("text") or ""
+            for item in body.get("output") or []
+            for part in item.get("content") or []
+            if part.get("type") == "output_text"
+        ]
+        return "".join(parts) or None
 
+    def _prepare_request(
+        self,
+        segments: Sequence[TextSegment],
+        *,
+        source_language: str | None,
+        target_language: str,
+    ) -> tuple[str, str, List[List[str]]]:
+        """Build the system prompt and the JSON-encoded user payload for a batch.
+
+        Identical texts are sent once under a short synthetic id (``u0``,
+        ``u1``, ...); the returned groups list the segment ids behind each
+        synthetic id, in order. The payload is encoded once here and handed
+        to the SDK as-is.
+        """
+
+        unique: Dict[str, List[str]] = {}
+        for segment in segments:
+            unique.setdefault(segment.text, []).append(segment.segment_id)
         payload = [
-            {"id": segment.segment_id, "text": segment.text}
-            for segment in segments
+            {"id": f"{_UNIQUE_ID_PREFIX}{index}", "text": text}
+            for index, text in enumerate(unique)
         ]
-        system_prompt = (
-            "You are a professional translator. Return only JSON. "
-            "Translate the provided text segments into the requested language. "
-            "Preserve formatting, placeholders, numbers, and markup. "
-            "Respond strictly with an object shaped as "
-            '{"translations": [{"id": "...", "translated": "..."}]}. '
-            "Input may include tags such as <run id=\"…\">…</run>; keep tags and their "
-            "attributes exactly as provided, translate only the inner text, and you may "
-            "redistribute translated words across sequential runs as needed while "
-            "preserving tag order. "
-            "Do not add commentary. Do not wrap the JSON in markdown code fences."
-        )
         user_prompt = {
             "target_language": target_language,
             "source_language": source_language,
             "segments": payload,
         }
-        self._log_debug("provider.request.system_prompt", system_prompt)
+        self._log_debug("provider.request.system_prompt", SYSTEM_PROMPT)
         self._log_debug("provider.request.payload", user_prompt)
-
-        response_items = self._invoke_model(
-            system_prompt=system_prompt,
-            user_payload=user_prompt,
-            model=model or self._default_model,
+        return (
+            SYSTEM_PROMPT,
+            _dumps_compact(user_prompt),
+            list(unique.values()),
         )
+
+    def _build_mapping(
+        self, response_items: list[dict[str, Any]], groups: List[List[str]]
+    ) -> Dict[str, str]:
+        """Validate response items and map segment ids to translations.
+
+        Each translation for a synthetic id is fanned out to every segment
+        id in its group; ids the request did not contain are ignored.
+        """
+
         self._log_debug("provider.response.items", response_items)
 
+        try:
+            pairs = list(map(_ID_AND_TRANSLATION, response_items))
+        except (KeyError, TypeError):
+            pairs = None
+        if pairs is None or not all(
+            isinstance(segment_id, str) and isinstance(translated, str)
+            for segment_id, translated in pairs
+        ):
+            raise self._malformed_items_error(response_items)
+        translated_by_id = dict(pairs)
         mapping: Dict[str, str] = {}
+        for index, segment_ids in enumerate(groups):
+            translated = translated_by_id.get(f"{_UNIQUE_ID_PREFIX}{index}")
+            if translated is not None:
+                for segment_id in segment_ids:
+                    mapping[segment_id] = translated
+
+        self._log_debug("provider.response.mapping", mapping)
+        return mapping
+
+    @staticmethod
+    def _malformed_items_error(response_items: Sequence[Any]) -> TranslationProviderError:
+        """Describe the first response item that is not a valid translation."""
+
         for item in response_items:
             if not isinstance(item, dict):
-                raise TranslationProviderError(
+                return TranslationProviderError(
                     "Translation provider response malformed: expected objects."
                 )
-            segment_id = item.get("id")
-            translated = item.get("translated")
-            if not isinstance(segment_id, str) or not isinstance(translated, str):
-                raise TranslationProviderError(
-                    "Translation provider response malformed: missing fields."
-                )
-            mapping[segment_id] = translated
+            if not isinstance(item.get("id"), str) or not isinstance(
+                item.get("translated"), str
+            ):
+                break
+        return TranslationProviderError(
+            "Translation provider response malformed: missing fields."
+        )
 
-        self._log_debug("provider.response.mapping", mapping)
-        return mapping
+    def _create_response(
+        self,
+        client: Any,
+        *,
+        system_prompt: str,
+        user_content: str,
+        model: str,
+        stream: bool = False,
+    ) -> Any:
+        """Issue the Responses API request; returns an awaitable for async clients."""
+
+        return client.responses.create(
+            stream=stream,
+            **self._request_body(
+                system_prompt=system_prompt, user_content=user_content, model=model
+            ),
+        )
+
+    def _request_body(
+        self, *, system_prompt: str, user_content: str, model: str
+    ) -> dict[str, Any]:
+        """Return the Responses API request parameters for one batch."""
+
+        return dict(
+            model=model,
+            input=[
+                _responses_system_message(system_prompt),
+                {
+                    "role": "user",
+                    "content": [
+                        {
+                            "type": "input_text",
+                            "text": user_content,
+                        }
+                    ],
+                },
+            ],
+            text={"format": _TRANSLATIONS_FORMAT},
+        )
 
     def _invoke_model(
         self,
         *,
         system_prompt: str,
-        user_payload: dict,
+        user_content: str,
+        model: str,
+    ) -> list[dict[str, Any]]:
+        """Call the model API and return structured JSON data."""
+
+        if self.stream:
+            return self._invoke_model_streaming(
+                system_prompt=system_prompt,
+                user_content=user_content,
+                model=model,
+            )
+
+        client = self._get_client()
+        try:
+            response = self._create_response(
+                client,
+                system_prompt=system_prompt,
+                user_content=user_content,
+                model=model,
+            )
+        except Exception as exc:  # pragma: no cover - network call
+            raise _service_unavailable(exc) from exc
+        if self.debug:
+            self._log_debug("provider.response.raw", self._safe_dump_response(response))
+        return self._extract_translations(response)
+
+    def _invoke_model_streaming(
+        self,
+        *,
+        system_prompt: str,
+        user_content: str,
         model: str,
     ) -> list[dict[str, Any]]:
-        """Call the OpenAI Responses API and return structured JSON data."""
+        """Stream the model output, decoding translations as each object closes."""
 
+        parser = _TranslationStreamParser()
+        chunks: List[str] = []
+        client = self._get_client()
         try:
-            response = self._client.responses.create(
+            events = self._create_response(
+                client,
+                system_prompt=system_prompt,
+                user_content=user_content,
                 model=model,
-                input=[
-                    {
-                        "role": "system",
-                        "content": [
-                            {"type": "input_text", "text": system_prompt},
-                        ],
-                    },
-                    {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "input_text",
-                                "text": json.dumps(user_payload, ensure_ascii=False),
-                            }
-                        ],
-                    },
-                ],
+                stream=True,
+            )
+            for event in events:
+                text = self._stream_event_text(event)
+                if text:
+                    chunks.append(text)
+                    parser.feed(text)
+        except Exception as exc:  # pragma: no cover - network call
+            raise _service_unavailable(exc, items=parser.items) from exc
+        return self._finish_stream(parser, chunks)
+
+    async def _ainvoke_model_streaming(
+        self,
+        *,
+        system_prompt: str,
+        user_content: str,
+        model: str,
+    ) -> list[dict[str, Any]]:
+        """Async counterpart of ``_invoke_model_streaming``."""
+
+        parser = _TranslationStreamParser()
+        chunks: List[str] = []
+        client = self._get_async_client()
+        try:
+            events = await self._create_response(
+                client,
+                system_prompt=system_prompt,
+                user_content=user_content,
+                model=model,
+                stream=True,
             )
+            async for event in events:
+                text = self._stream_event_text(event)
+                if text:
+                    chunks.append(text)
+                    parser.feed(text)
         except Exception as exc:  # pragma: no cover - network call
+            raise _service_unavailable(exc, items=parser.items) from exc
+        return self._finish_stream(parser, chunks)
+
+    def _stream_event_text(self, event: Any) -> str | None:
+        """Return the output text delta carried by a streamed Responses event."""
+
+        if getattr(event, "type", None) == "response.output_text.delta":
+            return getattr(event, "delta", None)
+        return None
+
+    def _finish_stream(
+        self, parser: _TranslationStreamParser, chunks: List[str]
+    ) -> list[dict[str, Any]]:
+        """Return streamed translations, falling back to parsing the full text."""
+
+        self._log_debug("provider.response.raw", "".join(chunks))
+        if parser.complete:
+            return parser.items
+        if not chunks:
             raise TranslationProviderError(
-                f"Translation service temporarily unavailable — {exc}"
-            ) from exc
-        self._log_debug("provider.response.raw", self._safe_dump_response(response))
+                "Translation provider response empty or unrecognised."
+            )
+        return self._normalise_translations("".join(chunks))
+
+    async def _ainvoke_model(
+        self,
+        *,
+        system_prompt: str,
+        user_content: str,
+        model: str,
+    ) -> list[dict[str, Any]]:
+        """Async counterpart of ``_invoke_model`` using the async SDK client."""
+
+        if self.stream:
+            return await self._ainvoke_model_streaming(
+                system_prompt=system_prompt,
+                user_content=user_content,
+                model=model,
+            )
+
+        client = self._get_async_client()
+        try:
+            response = await self._create_response(
+                client,
+                system_prompt=system_prompt,
+                user_content=user_content,
+                model=model,
+            )
+        except Exception as exc:  # pragma: no cover - network call
+            raise _service_unavailable(exc) from exc
+        if self.debug:
+            self._log_debug("provider.response.raw", self._safe_dump_response(response))
         return self._extract_translations(response)
 
     def _log_debug(self, label: str, payload: Any) -> None:
@@ -233,19 +1216,10 @@ class OpenAITranslationProvider(TranslationProvider):
     def _safe_dump_response(self, response: Any) -> Any:
         """Best-effort conversion of Responses API objects into JSON-friendly data."""
 
-        for attr in ("model_dump_json", "model_dump"):
-            candidate = getattr(response, attr, None)
-            if candidate:
-                try:
-                    data = candidate()
-                    if isinstance(data, str):
-                        return json.loads(data)
-                    return data
-                except Exception:
-                    continue
-        if hasattr(response, "__dict__"):
+        model_dump = getattr(response, "model_dump", None)
+        if model_dump is not None:
             try:
-                return json.loads(json.dumps(response.__dict__, default=str))
+                return model_dump(mode="json")
             except Exception:
                 pass
         return str(response)
@@ -253,15 +1227,12 @@ class OpenAITranslationProvider(TranslationProvider):
     def _strip_code_fence(self, text: str) -> str:
         """Remove leading/trailing markdown code fences if present."""
 
-        stripped = text.strip()
-        if not stripped.startswith("```"):
-            return stripped
-
-        # Drop opening fence and optional language hint.
-        first_newline = stripped.find("\n")
-        if first_newline == -1:
-            return stripped
-        body = stripped[first_newline + 1 :]
+        # The opening fence and optional language hint run up to the first
+        # newline; without a complete opening line there is nothing to strip.
+        opening = _FENCE_OPEN.match(text)
+        if opening is None:
+            return text.strip()
+        body = text[opening.end() :]
         closing_index = body.rfind("```")
         if closing_index != -1:
             body = body[:closing_index]
@@ -277,23 +1248,31 @@ class OpenAITranslationProvider(TranslationProvider):
                 if parts is None:
                     continue
                 for part in parts:
-                    json_value = getattr(part, "json", None)
-                    if hasattr(json_value, "value"):
-                        json_value = json_value.value
-                    if json_value is not None:
-                        if isinstance(json_value, dict):
-                            translations = json_value.get("translations")
-                            if isinstance(translations, list):
-                                return translations
-                        if isinstance(json_value, list):
-                            return json_value
-                    text_value = getattr(part, "text", None)
-                    if hasattr(text_value, "value"):
-                        text_value = text_value.value
+                    try:
+                        part_type, text_value = _PART_TYPE_AND_TEXT(part)
+                    except AttributeError:
+                        part_type = text_value = None
+                    if part_type not in _TEXT_PART_TYPES or not isinstance(
+                        text_value, str
+                    ):
+                        # Generic walk for JSON parts and SDK wrapper values.
+                        json_value = getattr(part, "json", None)
+                        if hasattr(json_value, "value"):
+                            json_value = json_value.value
+                        if json_value is not None:
+                            if isinstance(json_value, dict):
+                                translations = json_value.get("translations")
+                                if isinstance(translations, list):
+                                    return translations
+                            if isinstance(json_value, list):
+                                return json_value
+                        text_value = getattr(part, "text", None)
+                        if hasattr(text_value, "value"):
+                            text_value = text_value.value
                     if text_value:
                         text_value = self._strip_code_fence(str(text_value))
                         try:
-                            parsed = json.loads(text_value)
+                            parsed = _loads(text_value)
                         except json.JSONDecodeError:
                             continue
                         return self._normalise_translations(parsed)
@@ -318,7 +1297,7 @@ class OpenAITranslationProvider(TranslationProvider):
         if isinstance(payload, str):
             payload = self._strip_code_fence(payload)
             try:
-                payload = json.loads(payload)
+                payload = _loads(payload)
             except json.JSONDecodeError as exc:
                 raise TranslationProviderError(
                     f"Translation provider returned invalid JSON: {exc}"
@@ -340,32 +1319,65 @@ class OpenAITranslationProvider(TranslationProvider):
 class LegacyOpenAITranslationProvider(OpenAITranslationProvider):
     """Translation provider that uses the Chat Completions API for compatibility."""
 
-    def _invoke_model(
+    BATCH_ENDPOINT = "/v1/chat/completions"
+
+    def _create_response(
         self,
+        client: Any,
         *,
         system_prompt: str,
-        user_payload: dict,
+        user_content: str,
         model: str,
-    ) -> list[dict[str, Any]]:
-        """Call the Chat Completions API and return structured JSON data."""
+        stream: bool = False,
+    ) -> Any:
+        """Issue the Chat Completions request; returns an awaitable for async clients."""
 
-        try:
-            response = self._client.chat.completions.create(
-                model=model,
-                temperature=0,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {
-                        "role": "user",
-                        "content": json.dumps(user_payload, ensure_ascii=False),
-                    },
-                ],
-            )
-        except Exception as exc:  # pragma: no cover - network call
-            raise TranslationProviderError(
-                f"Translation service temporarily unavailable — {exc}"
-            ) from exc
-        self._log_debug("provider.response.raw", self._safe_dump_response(response))
+        return client.chat.completions.create(
+            stream=stream,
+            **self._request_body(
+                system_prompt=system_prompt, user_content=user_content, model=model
+            ),
+        )
+
+    def _request_body(
+        self, *, system_prompt: str, user_content: str, model: str
+    ) -> dict[str, Any]:
+        """Return the Chat Completions request parameters for one batch."""
+
+        return dict(
+            model=model,
+            temperature=0,
+            messages=[
+                _chat_system_message(system_prompt),
+                {
+                    "role": "user",
+                    "content": user_content,
+                },
+            ],
+        )
+
+    def _batch_body_text(self, body: dict[str, Any]) -> str | None:
+        """Return the message text of a Chat Completions Batch API result body."""
+
+        for choice in body.get("choices") or []:
+            content = (choice.get("message") or {}).get("content")
+            if content:
+                return content
+        return None
+
+    def _stream_event_text(self, event: Any) -> str | None:
+        """Return the content deltas carried by a streamed Chat Completions chunk."""
+
+        parts: list[str] = []
+        for choice in getattr(event, "choices", None) or []:
+            delta = getattr(choice, "delta", None)
+            content = getattr(delta, "content", None)
+            if content:
+                parts.append(content)
+        return "".join(parts) if parts else None
+
+    def _extract_translations(self, response: Any) -> list[dict[str, Any]]:
+        """Extract the structured translation list from a Chat Completions result."""
 
         content: str | None = None
         choices = getattr(response, "choices", None) or []
@@ -407,16 +1419,31 @@ class LegacyOpenAITranslationProvider(OpenAITranslationProvider):
         return translations
 
 
+_OPENAI_NAMES = frozenset(("openai", "gpt", "default"))
+_LEGACY_OPENAI_NAMES = frozenset(("legacy-openai", "legacy_openai", "legacy", "openai-legacy"))
+_ECHO_NAMES = frozenset(("echo", "noop", "mock"))
+_KNOWN_PROVIDER_NAMES = _OPENAI_NAMES | _LEGACY_OPENAI_NAMES | _ECHO_NAMES
+
+
 def build_provider(name: str | None, *, debug: bool = False) -> TranslationProvider:
-    """Factory to create providers by name."""
+    """Factory to create providers by name.
+
+    Providers are cached per normalised name and debug flag, so repeated runs
+    in one process reuse the SDK client instead of rebuilding it.
+    """
 
     normalized = (name or "openai").strip().lower()
-    if normalized in {"openai", "gpt", "default"}:
+    if normalized not in _KNOWN_PROVIDER_NAMES:
+        raise TranslationProviderConfigurationError(
+            f"Unknown translation provider '{name}'."
+        )
+    return _cached_provider(normalized, debug)
+
+
+@functools.cache
+def _cached_provider(normalized: str, debug: bool) -> TranslationProvider:
+    if normalized in _OPENAI_NAMES:
         return OpenAITranslationProvider(debug=debug)
-    if normalized in {"legacy-openai", "legacy_openai", "legacy", "openai-legacy"}:
+    if normalized in _LEGACY_OPENAI_NAMES:
         return LegacyOpenAITranslationProvider(debug=debug)
-    if normalized in {"echo", "noop", "mock"}:
-        return EchoTranslationProvider()
-    raise TranslationProviderConfigurationError(
-        f"Unknown translation provider '{name}'."
-    )
+    return EchoTranslationProvider()
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import re
-from typing import List, Sequence
+from typing import Iterable, Iterator, List, Sequence
 
 from .structures import Batch, TextSegment, TextUnit
 
@@ -13,68 +13,55 @@ SENTENCE_PATTERN = re.compile(
 CLAUSE_PATTERN = re.compile(
     r".+?(?:[,;:،，；：](?:\s+|$)|$)", re.DOTALL
 )
+# Leading whitespace on its own, then each word with its trailing whitespace.
+TOKEN_PATTERN = re.compile(r"\s+|\S+\s*")
+
+
+CJK_PATTERN = re.compile(
+    "["
+    "\u4e00-\u9fff"  # CJK Unified Ideographs
+    "\u3400-\u4dbf"  # Extension A
+    "\u3040-\u30ff"  # Hiragana/Katakana
+    "\uac00-\ud7af"  # Hangul syllables
+    "]"
+)
 
 
 def contains_cjk(text: str) -> bool:
     """Detect whether the text contains CJK characters."""
 
-    for char in text:
-        code = ord(char)
-        if (
-            0x4E00 <= code <= 0x9FFF  # CJK Unified Ideographs
-            or 0x3400 <= code <= 0x4DBF  # Extension A
-            or 0x3040 <= code <= 0x30FF  # Hiragana/Katakana
-            or 0xAC00 <= code <= 0xD7AF  # Hangul syllables
-        ):
-            return True
-    return False
+    return CJK_PATTERN.search(text) is not None
 
 
 def _consume_pattern(pattern: re.Pattern[str], text: str) -> List[str]:
-    """Split text by greedily consuming matches from the start of a string."""
+    """Split text into consecutive pattern matches in a single scan.
+
+    Text between or after matches (never produced by the bundled patterns,
+    which always match at least one character) is kept as its own piece.
+    """
 
     if not text:
         return []
 
     segments: List[str] = []
     index = 0
-    length = len(text)
-    while index < length:
-        match = pattern.match(text, index)
-        if not match:
-            # If no match is found, consume the rest of the text.
-            segments.append(text[index:])
-            break
-        end = match.end()
-        if end == index:
-            # Avoid zero-length loops by consuming at least one character.
-            end += 1
-        segments.append(text[index:end])
+    for match in pattern.finditer(text):
+        start, end = match.span()
+        if start == end:
+            continue
+        if start != index:
+            segments.append(text[index:start])
+        segments.append(match.group())
         index = end
+    if index < len(text):
+        segments.append(text[index:])
     return segments
 
 
 def _tokenise_preserving_whitespace(text: str) -> List[str]:
     """Tokenise text into word+space tokens without losing whitespace."""
 
-    tokens: List[str] = []
-    idx = 0
-    length = len(text)
-    while idx < length:
-        if text[idx].isspace():
-            start = idx
-            while idx < length and text[idx].isspace():
-                idx += 1
-            tokens.append(text[start:idx])
-        else:
-            start = idx
-            while idx < length and not text[idx].isspace():
-                idx += 1
-            end = idx
-            while idx < length and text[idx].isspace():
-                idx += 1
-            tokens.append(text[start:idx])
-    return tokens
+    return TOKEN_PATTERN.findall(text)
 
 
 def _split_cjk(text: str, budget: int) -> List[str]:
@@ -100,28 +87,30 @@ def _split_words(text: str, budget: int) -> List[str]:
         return []
 
     segments: List[str] = []
-    current = ""
+    current: List[str] = []
+    current_len = 0
 
     for token in tokens:
-        if len(token) > budget:
+        token_len = len(token)
+        if token_len > budget:
             # Fallback to CJK-aware splitting when a token still exceeds budget.
             if current:
-                segments.append(current)
-                current = ""
-            if contains_cjk(token):
-                segments.extend(_split_cjk(token, budget))
-            else:
-                segments.extend(_split_cjk(token, budget))
+                segments.append("".join(current))
+                current = []
+                current_len = 0
+            segments.extend(_split_cjk(token, budget))
             continue
 
-        if len(current) + len(token) > budget and current:
-            segments.append(current)
-            current = token
+        if current_len + token_len > budget and current:
+            segments.append("".join(current))
+            current = [token]
+            current_len = token_len
         else:
-            current += token
+            current.append(token)
+            current_len += token_len
 
     if current:
-        segments.append(current)
+        segments.append("".join(current))
 
     return segments
 
@@ -130,26 +119,32 @@ def _pack_segments(chunks: Sequence[str], budget: int) -> List[str]:
     """Greedily pack smaller chunks into budget-sized segments."""
 
     packed: List[str] = []
-    current = ""
+    current: List[str] = []
+    current_len = 0
     for chunk in chunks:
         if not chunk:
             continue
-        if len(chunk) > budget:
+        chunk_len = len(chunk)
+        if chunk_len > budget:
             if current:
-                packed.append(current)
-                current = ""
-            if contains_cjk(chunk.strip()) or not chunk.strip():
+                packed.append("".join(current))
+                current = []
+                current_len = 0
+            stripped = chunk.strip()
+            if not stripped or contains_cjk(stripped):
                 packed.extend(_split_cjk(chunk, budget))
             else:
                 packed.extend(_split_words(chunk, budget))
             continue
-        if len(current) + len(chunk) > budget and current:
-            packed.append(current)
-            current = chunk
+        if current_len + chunk_len > budget and current:
+            packed.append("".join(current))
+            current = [chunk]
+            current_len = chunk_len
         else:
-            current += chunk
+            current.append(chunk)
+            current_len += chunk_len
     if current:
-        packed.append(current)
+        packed.append("".join(current))
     return packed
 
 
@@ -186,26 +181,39 @@ class Segmenter:
     def segment_units(self, units: Sequence[TextUnit]) -> List[TextSegment]:
         segments: List[TextSegment] = []
         for unit in units:
-            if unit.atomic:
-                raw_segments = (
-                    [unit.original_text] if unit.original_text else []
-                )
-            else:
-                raw_segments = segment_text(unit.original_text, self.budget)
+            raw_segments = self._split_unit(unit)
             if not raw_segments:
                 continue
-            unit.segments = []
-            for idx, content in enumerate(raw_segments):
-                segment = TextSegment(
-                    segment_id=f"{unit.unit_id}#seg{idx}",
-                    unit_id=unit.unit_id,
-                    text=content,
-                    order=idx,
-                )
-                segments.append(segment)
-                unit.segments.append(segment)
+            unit.segments = self._segment_one(unit, raw_segments)
+            segments.extend(unit.segments)
         return segments
 
+    def segment_unit(self, unit: TextUnit) -> List[TextSegment]:
+        """Segment a single unit in place; used when units arrive one by one."""
+
+        raw_segments = self._split_unit(unit)
+        if raw_segments:
+            unit.segments = self._segment_one(unit, raw_segments)
+        return unit.segments
+
+    def _split_unit(self, unit: TextUnit) -> List[str]:
+        if unit.atomic:
+            return [unit.original_text] if unit.original_text else []
+        return segment_text(unit.original_text, self.budget)
+
+    @staticmethod
+    def _segment_one(unit: TextUnit, raw_segments: Sequence[str]) -> List[TextSegment]:
+        unit_id = unit.unit_id
+        return [
+            TextSegment(
+                segment_id=f"{unit_id}#seg{idx}",
+                unit_id=unit_id,
+                text=content,
+                order=idx,
+            )
+            for idx, content in enumerate(raw_segments)
+        ]
+
 
 class BatchBuilder:
     """Aggregates segments into batches within a character budget."""
@@ -213,26 +221,45 @@ class BatchBuilder:
     def __init__(self, budget: int) -> None:
         self.budget = max(1, budget)
 
-    def build(self, segments: Sequence[TextSegment]) -> List[Batch]:
-        batches: List[Batch] = []
+    def build(
+        self, segments: Sequence[TextSegment], *, reorder: bool = False
+    ) -> List[Batch]:
+        """Group segments into batches.
+
+        By default segments are packed greedily in document order, which keeps
+        neighbouring text together for context. With ``reorder=True`` they are
+        packed first-fit-decreasing, which usually needs fewer batches.
+        """
+
+        if reorder:
+            return self._build_first_fit_decreasing(segments)
+        return list(self.iter_batches(segments))
+
+    def iter_batches(self, segments: Iterable[TextSegment]) -> Iterator[Batch]:
+        """Pack segments greedily in document order, yielding each full batch.
+
+        Batches are yielded as soon as the budget is reached, so callers can
+        start translating before the remaining segments exist.
+        """
+
         batch_segments: List[TextSegment] = []
         running_total = 0
         batch_id = 1
 
         for segment in segments:
-            size = len(segment.text)
+            size = segment.size
             if size > self.budget:
                 if batch_segments:
-                    batches.append(Batch(batch_id=batch_id, segments=batch_segments))
+                    yield Batch(batch_id=batch_id, segments=batch_segments)
                     batch_id += 1
                     batch_segments = []
                     running_total = 0
-                batches.append(Batch(batch_id=batch_id, segments=[segment]))
+                yield Batch(batch_id=batch_id, segments=[segment])
                 batch_id += 1
                 continue
 
             if running_total + size > self.budget and batch_segments:
-                batches.append(Batch(batch_id=batch_id, segments=batch_segments))
+                yield Batch(batch_id=batch_id, segments=batch_segments)
                 batch_id += 1
                 batch_segments = []
                 running_total = 0
@@ -241,6 +268,36 @@ class BatchBuilder:
             running_total += size
 
         if batch_segments:
-            batches.append(Batch(batch_id=batch_id, segments=batch_segments))
-
-        return batches
+            yield Batch(batch_id=batch_id, segments=batch_segments)
+
+    def _build_first_fit_decreasing(
+        self, segments: Sequence[TextSegment]
+    ) -> List[Batch]:
+        bins: List[List[int]] = []
+        remaining: List[int] = []
+        order = sorted(
+            range(len(segments)), key=lambda i: segments[i].size, reverse=True
+        )
+        for index in order:
+            size = segments[index].size
+            if size > self.budget:
+                bins.append([index])
+                remaining.append(0)
+                continue
+            for slot, capacity in enumerate(remaining):
+                if size <= capacity:
+                    bins[slot].append(index)
+                    remaining[slot] = capacity - size
+                    break
+            else:
+                bins.append([index])
+                remaining.append(self.budget - size)
+
+        # Restore document order within and across batches.
+        for members in bins:
+            members.sort()
+        bins.sort(key=lambda members: members[0])
+        return [
+            Batch(batch_id=batch_id, segments=[segments[i] for i in members])
+            for batch_id, members in enumerate(bins, start=1)
+        ]
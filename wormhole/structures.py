@@ -3,13 +3,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Callable, List
+from typing import Any, Callable, List
 
 
 TextSetter = Callable[[str], None]
 
 
-@dataclass
+@dataclass(slots=True)
 class TextUnit:
     """Represents a single text element ready for translation."""
 
@@ -21,7 +21,7 @@ class TextUnit:
     atomic: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class TextSegment:
     """Represents a translation-ready segment derived from a TextUnit."""
 
@@ -29,11 +29,18 @@ class TextSegment:
     unit_id: str
     text: str
     order: int
+    size: int = field(init=False, repr=False)
 
+    def __post_init__(self) -> None:
+        # Measured once; batching decisions read this instead of len(text).
+        self.size = len(self.text)
 
-@dataclass
+
+@dataclass(slots=True)
 class Batch:
     """A batch of segments constrained by a character budget."""
 
     batch_id: int
     segments: List[TextSegment]
+    # Provider payload built on the first attempt and reused by retries.
+    prepared: Any = field(default=None, repr=False, compare=False)
@@ -0,0 +1,125 @@
+"""Persistent translation-memory cache backed by SQLite."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+import threading
+from typing import Dict, Iterable, Mapping
+
+TM_CACHE_ENV_NAME = "WORMHOLE_TM_CACHE"
+
+_SCHEMA = "CREATE TABLE IF NOT EXISTS tm (key BLOB PRIMARY KEY, translated TEXT NOT NULL)"
+# SQLite caps the number of bound parameters per statement; stay well below.
+_LOOKUP_CHUNK = 500
+
+
+class TranslationMemory:
+    """Maps (text, languages, model) to a previously returned translation."""
+
+    def __init__(self, path: str) -> None:
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(_SCHEMA)
+        self._connection.commit()
+
+    @staticmethod
+    def _key(
+        text: str,
+        *,
+        source_language: str | None,
+        target_language: str,
+        model: str,
+    ) -> bytes:
+        material = "\x00".join((source_language or "", target_language, model, text))
+        return hashlib.blake2b(material.encode("utf-8"), digest_size=16).digest()
+
+    def lookup(
+        self,
+        texts: Iterable[str],
+        *,
+        source_language: str | None,
+        target_language: str,
+        model: str,
+    ) -> Dict[str, str]:
+        """Return cached translations for the given texts, keyed by text."""
+
+        keys: Dict[bytes, str] = {
+            self._key(
+                text,
+                source_language=source_language,
+                target_language=target_language,
+                model=model,
+            ): text
+            for text in texts
+        }
+        if not keys:
+            return {}
+
+        found: Dict[str, str] = {}
+        pending = list(keys)
+        with self._lock:
+            for start in range(0, len(pending), _LOOKUP_CHUNK):
+                chunk = pending[start : start + _LOOKUP_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._connection.execute(
+                    f"SELECT key, translated FROM tm WHERE key IN ({placeholders})",
+                    chunk,
+                )
+                for key, translated in rows:
+                    found[keys[key]] = translated
+        return found
+
+    def store(
+        self,
+        translations: Mapping[str, str],
+        *,
+        source_language: str | None,
+        target_language: str,
+        model: str,
+    ) -> None:
+        """Persist text -> translation pairs in a single transaction.
+
+        Entries are recalled on every later run, so only pairs that look
+        like real translations are kept: an empty reply, or the source text
+        handed back unchanged, is more often a failed call than a result.
+        """
+
+        rows = [
+            (
+                self._key(
+                    text,
+                    source_language=source_language,
+                    target_language=target_language,
+                    model=model,
+                ),
+                translated,
+            )
+            for text, translated in translations.items()
+            if translated.strip() and translated != text
+        ]
+        if not rows:
+            return
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO tm (key, translated) VALUES (?, ?)", rows
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+def open_translation_memory() -> TranslationMemory | None:
+    """Open the cache configured through ``WORMHOLE_TM_CACHE``, if any."""
+
+    path = os.getenv(TM_CACHE_ENV_NAME, "").strip()
+    if not path:
+        return None
+    return TranslationMemory(os.path.expanduser(path))
@@ -2,22 +2,47 @@
 
 from __future__ import annotations
 
+import asyncio
+import heapq
+import os
 import pathlib
+import random
+import sqlite3
+import stat
+import sys
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
-from typing import Dict, List, Sequence
+from itertools import groupby
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Sequence
 
 from .documents import detect_handler
 from .errors import (
     ErrorCategory,
+    ErrorRecord,
     OverwriteRefusedError,
     TranslationProviderError,
+    TranslationServiceUnavailableError,
     WormholeError,
 )
 from .policy import ErrorPolicy
-from .providers import TranslationProvider, build_provider
+from .providers import PreparedBatch, TranslationProvider, build_provider
 from .segmenter import BatchBuilder, Segmenter
-from .structures import Batch, TextSegment
+from .structures import Batch, TextSegment, TextUnit
+from .tm_cache import TranslationMemory
+
+# Batches are I/O bound (one HTTPS round trip each), so several are kept in
+# flight at once.
+DEFAULT_CONCURRENCY = 8
+DEFAULT_MAX_RETRIES = 3
+CHECKPOINT_SUFFIX = ".wh_ckpt"
+
+# Batches held back so the largest can be dispatched first (LPT order).
+_LOOKAHEAD_FACTOR = 4
+
+_UNIT_ID = attrgetter("unit_id")
 
 
 @dataclass
@@ -38,7 +63,74 @@ class TranslationSummary:
     target_language: str
     source_language: str | None
     elapsed_seconds: float
-    error_messages: List[str] = field(default_factory=list)
+    error_records: List[ErrorRecord] = field(default_factory=list)
+
+    @property
+    def error_messages(self) -> List[str]:
+        return [record.message for record in self.error_records]
+
+
+def _largest_first(batches: Iterable[Batch], lookahead: int) -> Iterator[Batch]:
+    """Reorder a batch stream so larger batches are dispatched first.
+
+    Starting the longest requests first keeps one slow batch from
+    finishing last. Only ``lookahead`` batches are held back, so batches
+    still stream; when they all fit this is a full largest-first sort.
+    """
+
+    heap: List[tuple[int, int, Batch]] = []
+    for batch in batches:
+        size = sum(segment.size for segment in batch.segments)
+        heapq.heappush(heap, (-size, batch.batch_id, batch))
+        if len(heap) > lookahead:
+            yield heapq.heappop(heap)[2]
+    while heap:
+        yield heapq.heappop(heap)[2]
+
+
+class _SegmentBuffers:
+    """Translated segment texts for every unit, stored in flat arrays.
+
+    Each unit owns a contiguous slot range; ``_done`` flags filled slots so
+    completeness is a C-level byte count rather than a scan for ``None``.
+    Units are only added from the dispatching thread, while workers fill
+    slots of units already added.
+    """
+
+    __slots__ = ("_texts", "_done", "_slots")
+
+    def __init__(self) -> None:
+        self._texts: List[str] = []
+        self._done = bytearray()
+        self._slots: Dict[str, tuple[int, int]] = {}
+
+    def add_unit(self, unit_id: str, length: int) -> None:
+        self._slots[unit_id] = (len(self._texts), length)
+        self._texts.extend([""] * length)
+        self._done.extend(bytes(length))
+
+    def start(self, unit_id: str) -> int:
+        return self._slots[unit_id][0]
+
+    def store(self, index: int, text: str) -> None:
+        self._texts[index] = text
+        self._done[index] = 1
+
+    def put(self, segment: TextSegment, text: str) -> None:
+        self.store(self._slots[segment.unit_id][0] + segment.order, text)
+
+    def get(self, segment: TextSegment) -> str | None:
+        index = self._slots[segment.unit_id][0] + segment.order
+        return self._texts[index] if self._done[index] else None
+
+    def unit_text(self, unit_id: str) -> str | None:
+        """Return the unit's joined translation, or ``None`` if incomplete."""
+
+        start, length = self._slots[unit_id]
+        end = start + length
+        if self._done.count(0, start, end):
+            return None
+        return "".join(self._texts[start:end])
 
 
 class TranslationRunner:
@@ -57,6 +149,9 @@ class TranslationRunner:
         interactive: bool,
         verbose: bool,
         provider_debug: bool,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        use_batch_api: bool = False,
     ) -> None:
         self.input_path = input_path
         self.output_path = output_path
@@ -68,57 +163,119 @@ class TranslationRunner:
         self.interactive = interactive
         self.verbose = verbose
         self.provider_debug = provider_debug
+        self.concurrency = max(1, concurrency)
+        self.use_batch_api = use_batch_api
 
         self.error_policy = ErrorPolicy(interactive=interactive)
-        self.max_retries = 3
-        self.retry_backoff = [1, 4, 9]
+        # Serialises error-policy updates (and any prompt) across workers.
+        self._policy_lock = threading.Lock()
+        self.max_retries = max_retries
+        # Exponential backoff with full jitter, in seconds.
+        self.retry_base_delay = 1.0
+        self.retry_max_delay = 30.0
+
+        # Translations of finished batches, kept next to the output until it
+        # is saved so an interrupted run can resume. The file is only created
+        # once there is something to store.
+        self.checkpoint_path = output_path.with_name(
+            output_path.name + CHECKPOINT_SUFFIX
+        )
+        self._checkpoint: TranslationMemory | None = None
+        self._checkpoint_enabled = True
+        self._checkpoint_lock = threading.Lock()
+        self._resumed_segments = 0
 
     def run(self) -> TranslationSummary:
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         document_type, handler = detect_handler(self.input_path)
-        units = handler.extract_text_units()
+        provider = build_provider(self.provider_name, debug=self.provider_debug)
 
-        segmenter = Segmenter(self.batch_budget)
-        segments = segmenter.segment_units(units)
+        # Extraction, segmentation and batching run lazily on this thread
+        # while the batches already produced are being translated.
+        units: List[TextUnit] = []
+        buffers = _SegmentBuffers()
+        groups: Dict[str, List[TextSegment]] = {}
+        segments = self._stream_segments(handler.iter_text_units(), units, buffers)
+        batches = BatchBuilder(self.batch_budget).iter_batches(
+            self._first_occurrences(segments, groups)
+        )
+        self._checkpoint_enabled = True
+        if self.checkpoint_path.exists():
+            self._checkpoint = self._open_checkpoint()
+        if self._checkpoint is not None:
+            batches = self._resume(batches, buffers)
+        if not self.use_batch_api:
+            batches = _largest_first(batches, self.concurrency * _LOOKAHEAD_FACTOR)
+
+        translate_bulk = getattr(provider, "translate_bulk", None)
+        if self.use_batch_api and translate_bulk is None:
+            self._report(
+                "The selected provider does not support batch jobs; "
+                "translating batches directly."
+            )
+        try:
+            if self.use_batch_api and translate_bulk is not None:
+                total_batches = self._run_batch_job(
+                    provider=provider,
+                    translate_bulk=translate_bulk,
+                    batches=list(batches),
+                    buffers=buffers,
+                )
+            elif provider.NATIVE_ASYNC:
+                total_batches = asyncio.run(
+                    self._dispatch_batches_async(
+                        provider=provider,
+                        batches=batches,
+                        buffers=buffers,
+                    )
+                )
+            else:
+                total_batches = self._dispatch_batches(
+                    provider=provider,
+                    batches=batches,
+                    buffers=buffers,
+                )
+        finally:
+            provider.close()
+            if self._checkpoint is not None:
+                self._checkpoint.close()
+                self._checkpoint = None
+        handler.register_units(units)
+        self._fill_duplicates(groups, buffers)
 
-        batch_builder = BatchBuilder(self.batch_budget)
-        batches = batch_builder.build(segments)
+        total_segments = sum(len(group) for group in groups.values())
         if self.verbose:
-            print(
+            self._report(
                 f"Prepared {len(units)} text units, "
-                f"{len(segments)} segments, {len(batches)} batches."
+                f"{total_segments} segments ({len(groups)} unique), "
+                f"{total_batches} batches."
             )
+            if self._resumed_segments:
+                self._report(
+                    f"Resumed {self._resumed_segments} segments from "
+                    f"{self.checkpoint_path.name}."
+                )
 
-        provider = build_provider(self.provider_name, debug=self.provider_debug)
-
-        buffers: Dict[str, List[str | None]] = {
-            unit.unit_id: [None] * len(unit.segments) for unit in units
-        }
-
-        total_segments = len(segments)
         translated_units = 0
         skipped_units = 0
-
-        for batch in batches:
-            self._process_batch(
-                provider=provider,
-                batch=batch,
-                buffers=buffers,
-            )
+        # Successes only reset the consecutive-error counter, so one reset
+        # after each error (or after dispatch) is equivalent to one per unit.
+        reset_pending = True
 
         for unit in units:
-            seg_buffer = buffers.get(unit.unit_id, [])
-            if not seg_buffer:
+            if not unit.segments:
                 continue
-            if any(value is None for value in seg_buffer):
+            translated_text = buffers.unit_text(unit.unit_id)
+            if translated_text is None:
                 skipped_units += 1
                 continue
-            translated_text = "".join(seg_buffer)  # type: ignore[arg-type]
             try:
                 unit.setter(translated_text)
                 translated_units += 1
-                self.error_policy.record_success()
+                if reset_pending:
+                    self.error_policy.record_success()
+                    reset_pending = False
             except Exception as exc:
                 message = (
                     f"Could not reinsert translated text at {unit.location}. "
@@ -128,12 +285,14 @@ class TranslationRunner:
                     ErrorCategory.REINSERTION,
                     f"{message} ({exc})",
                 )
+                reset_pending = True
                 if action == "retry":
                     # Attempt once more immediately.
                     try:
                         unit.setter(translated_text)
                         translated_units += 1
                         self.error_policy.record_success()
+                        reset_pending = False
                         continue
                     except Exception as retry_exc:
                         self.error_policy.handle_error(
@@ -144,8 +303,9 @@ class TranslationRunner:
                 skipped_units += 1
 
         handler.save(self.output_path)
+        self._remove_checkpoint()
 
-        elapsed = time.time() - start_time
+        elapsed = time.perf_counter() - start_time
         summary = TranslationSummary(
             input_path=self.input_path,
             output_path=self.output_path,
@@ -154,101 +314,533 @@ class TranslationRunner:
             translated_units=translated_units,
             skipped_units=skipped_units,
             total_segments=total_segments,
-            total_batches=len(batches),
+            total_batches=total_batches,
             total_errors=len(self.error_policy.records),
             provider_name=self.provider_name or "openai",
             model=self.model,
             target_language=self.target_language,
             source_language=self.source_language,
             elapsed_seconds=elapsed,
-            error_messages=[record.message for record in self.error_policy.records],
+            error_records=self.error_policy.records,
         )
 
         return summary
 
+    def _checkpoint_scope(self) -> Dict[str, Any]:
+        return {
+            "source_language": self.source_language,
+            "target_language": self.target_language,
+            "model": f"{self.provider_name or 'openai'}/{self.model or ''}",
+        }
+
+    def _open_checkpoint(self) -> TranslationMemory | None:
+        try:
+            return TranslationMemory(str(self.checkpoint_path))
+        except (OSError, sqlite3.Error) as exc:
+            self._checkpoint_enabled = False
+            self._report(f"Progress will not be checkpointed ({exc}).")
+            return None
+
+    def _remove_checkpoint(self) -> None:
+        """Delete the checkpoint (and SQLite side files) after a saved run."""
+
+        for suffix in ("", "-wal", "-shm"):
+            path = self.checkpoint_path.with_name(self.checkpoint_path.name + suffix)
+            try:
+                path.unlink(missing_ok=True)
+            except OSError:
+                pass
+
+    def _resume(
+        self, batches: Iterable[Batch], buffers: _SegmentBuffers
+    ) -> Iterator[Batch]:
+        """Fill segments an earlier, interrupted run translated; yield the rest."""
+
+        checkpoint = self._checkpoint
+        scope = self._checkpoint_scope()
+        for batch in batches:
+            if checkpoint is None:
+                yield batch
+                continue
+            done = checkpoint.lookup(
+                {segment.text for segment in batch.segments}, **scope
+            )
+            if not done:
+                yield batch
+                continue
+            remaining: List[TextSegment] = []
+            for segment in batch.segments:
+                translated = done.get(segment.text)
+                if translated is None:
+                    remaining.append(segment)
+                else:
+                    buffers.put(segment, translated)
+            self._resumed_segments += len(batch.segments) - len(remaining)
+            if remaining:
+                yield Batch(batch_id=batch.batch_id, segments=remaining)
+
+    def _save_progress(
+        self, segments: Sequence[TextSegment], mapping: Dict[str, str]
+    ) -> None:
+        if not self._checkpoint_enabled:
+            return
+        translations = {
+            segment.text: mapping[segment.segment_id]
+            for segment in segments
+            if segment.segment_id in mapping
+        }
+        if not translations:
+            return
+        checkpoint = self._checkpoint
+        if checkpoint is None:
+            with self._checkpoint_lock:
+                if self._checkpoint is None and self._checkpoint_enabled:
+                    self._checkpoint = self._open_checkpoint()
+                checkpoint = self._checkpoint
+            if checkpoint is None:
+                return
+        try:
+            checkpoint.store(translations, **self._checkpoint_scope())
+        except sqlite3.Error as exc:
+            # Checkpointing is best effort; translation carries on without it.
+            self._checkpoint_enabled = False
+            self._report(f"Progress will no longer be checkpointed ({exc}).")
+
+    def _stream_segments(
+        self,
+        units: Iterable[TextUnit],
+        seen_units: List[TextUnit],
+        buffers: _SegmentBuffers,
+    ) -> Iterator[TextSegment]:
+        """Segment units as they are extracted, allocating their buffers."""
+
+        segmenter = Segmenter(self.batch_budget)
+        for unit in units:
+            seen_units.append(unit)
+            unit_segments = segmenter.segment_unit(unit)
+            buffers.add_unit(unit.unit_id, len(unit_segments))
+            yield from unit_segments
+
+    @staticmethod
+    def _first_occurrences(
+        segments: Iterable[TextSegment],
+        groups: Dict[str, List[TextSegment]],
+    ) -> Iterator[TextSegment]:
+        """Yield the first segment for each distinct text.
+
+        Source and target language and model are fixed for a run, so the
+        text alone identifies a translation. ``groups`` collects every
+        segment by text, the yielded (sent) segment first.
+        """
+
+        for segment in segments:
+            group = groups.get(segment.text)
+            if group is None:
+                groups[segment.text] = [segment]
+                yield segment
+            else:
+                group.append(segment)
+
+    @staticmethod
+    def _fill_duplicates(
+        groups: Dict[str, List[TextSegment]],
+        buffers: _SegmentBuffers,
+    ) -> None:
+        """Copy each sent segment's translation to the segments sharing its text."""
+
+        for first, *others in groups.values():
+            if not others:
+                continue
+            translated = buffers.get(first)
+            if translated is None:
+                continue
+            for segment in others:
+                buffers.put(segment, translated)
+
+    def _dispatch_batches(
+        self,
+        *,
+        provider: TranslationProvider,
+        batches: Iterable[Batch],
+        buffers: _SegmentBuffers,
+    ) -> int:
+        """Translate batches on a bounded thread pool; return how many ran.
+
+        Batches are submitted as they are produced, with at most twice the
+        pool size queued ahead of the workers. Each batch writes to its own
+        buffer slots. Once a worker raises (e.g. an abort), no further
+        batches are submitted and those not yet started are cancelled.
+        """
+
+        if self.concurrency == 1:
+            count = 0
+            for batch in batches:
+                self._process_batch(provider=provider, batch=batch, buffers=buffers)
+                count += 1
+            return count
+
+        window = threading.BoundedSemaphore(self.concurrency * 2)
+        failed = threading.Event()
+
+        def _release(future: Future[None]) -> None:
+            window.release()
+            if not future.cancelled() and future.exception() is not None:
+                failed.set()
+
+        executor = ThreadPoolExecutor(
+            max_workers=self.concurrency, thread_name_prefix="wormhole-batch"
+        )
+        futures: List[Future[None]] = []
+        try:
+            for batch in batches:
+                window.acquire()
+                if failed.is_set():
+                    window.release()
+                    break
+                future = executor.submit(
+                    self._process_batch,
+                    provider=provider,
+                    batch=batch,
+                    buffers=buffers,
+                )
+                future.add_done_callback(_release)
+                futures.append(future)
+            for future in as_completed(futures):
+                future.result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+        return len(futures)
+
+    async def _dispatch_batches_async(
+        self,
+        *,
+        provider: TranslationProvider,
+        batches: Iterable[Batch],
+        buffers: _SegmentBuffers,
+    ) -> int:
+        """Translate batches as coroutines on one event loop; return how many ran.
+
+        At most ``concurrency`` batches are in flight; producing the next
+        batch waits for a free slot. The first failure cancels the rest.
+        The provider's async resources belong to this loop and are released
+        before it closes.
+        """
+
+        window = asyncio.Semaphore(self.concurrency)
+        count = 0
+        try:
+            async with asyncio.TaskGroup() as group:
+                for batch in batches:
+                    await window.acquire()
+                    task = group.create_task(
+                        self._process_batch_async(
+                            provider=provider, batch=batch, buffers=buffers
+                        )
+                    )
+                    task.add_done_callback(lambda _task: window.release())
+                    count += 1
+                    # Let the new request start before extracting more text.
+                    await asyncio.sleep(0)
+        except ExceptionGroup as failures:
+            raise failures.exceptions[0] from None
+        finally:
+            await provider.aclose()
+        return count
+
+    def _run_batch_job(
+        self,
+        *,
+        provider: TranslationProvider,
+        translate_bulk: Callable[..., List[Dict[str, str] | BaseException]],
+        batches: List[Batch],
+        buffers: _SegmentBuffers,
+    ) -> int:
+        """Translate all batches in one provider batch job; return how many ran.
+
+        The job is cheaper but completes asynchronously, so this blocks until
+        the provider reports it finished. Batches the job could not
+        translate are reported together; if the user asks to retry, they
+        are resubmitted as a new job, otherwise they are skipped.
+        """
+
+        pending = batches
+        while pending:
+            try:
+                results = translate_bulk(
+                    [self._prepared(provider, batch) for batch in pending]
+                )
+            except TranslationProviderError as exc:
+                action = self._handle_error(
+                    ErrorCategory.TRANSLATION,
+                    f"The batch job failed. {exc}",
+                )
+                if action == "retry":
+                    continue
+                break
+
+            failed: List[Batch] = []
+            first_error: BaseException | None = None
+            for batch, result in zip(pending, results):
+                if isinstance(result, BaseException):
+                    if isinstance(result, TranslationProviderError) and result.partial:
+                        batch = self._keep_untranslated(batch, result.partial, buffers)
+                        if not batch.segments:
+                            continue
+                    failed.append(batch)
+                    first_error = first_error or result
+                    continue
+                self._map_translations(batch.segments, result, buffers)
+                self._record_success()
+            if not failed:
+                break
+            action = self._handle_error(
+                ErrorCategory.TRANSLATION,
+                f"{len(failed)} of {len(pending)} batches in the batch job could "
+                f"not be translated. {first_error}",
+            )
+            if action != "retry":
+                break
+            pending = failed
+
+        if self.verbose:
+            self._report(f"Batch job processed {len(batches)} batches.")
+        return len(batches)
+
+    @staticmethod
+    def _report(message: str) -> None:
+        # One write per line: print() writes the newline separately, which
+        # lets lines from concurrent workers interleave.
+        sys.stdout.write(f"{message}\n")
+
+    def _record_success(self) -> None:
+        with self._policy_lock:
+            self.error_policy.record_success()
+
+    def _handle_error(self, category: ErrorCategory, message: str) -> str:
+        with self._policy_lock:
+            return self.error_policy.handle_error(category, message)
+
     def _process_batch(
         self,
         *,
         provider: TranslationProvider,
         batch: Batch,
-        buffers: Dict[str, List[str | None]],
+        buffers: _SegmentBuffers,
     ) -> None:
+        """Translate one batch, retrying transient failures.
+
+        Translations a failed call still returned are kept, so retries only
+        cover the rest. A multi-segment batch whose first failure was not
+        a service outage is split in two; the halves share the batch's
+        remaining attempts, and skipping one still sends the other.
+        """
+
+        parts = [batch]
         attempt = 0
-        while True:
+        split = False
+        while parts:
             try:
-                mapping = provider.translate(
-                    batch.segments,
-                    source_language=self.source_language,
-                    target_language=self.target_language,
-                    model=self.model,
-                )
-                self._map_translations(batch.segments, mapping, buffers)
-                if self.verbose:
-                    total_chars = sum(len(segment.text) for segment in batch.segments)
-                    print(
-                        f"Processed batch {batch.batch_id} "
-                        f"({len(batch.segments)} segments, {total_chars} chars)."
-                    )
-                self.error_policy.record_success()
-                return
+                mapping = provider.translate_prepared(self._prepared(provider, parts[0]))
             except TranslationProviderError as exc:
                 attempt += 1
-                if attempt <= self.max_retries:
-                    wait_time = self.retry_backoff[min(attempt - 1, len(self.retry_backoff) - 1)]
-                    print(
-                        "Could not translate one batch "
-                        f"(attempt {attempt} of {self.max_retries} — {exc}). "
-                        "Retrying automatically..."
-                    )
-                    time.sleep(wait_time)
-                    continue
+                action, delay = self._after_failure(
+                    parts, exc, attempt=attempt, split=split, buffers=buffers
+                )
+                if action == "split":
+                    parts[:1] = self._halves(parts[0])
+                    split = True
+                elif action == "wait":
+                    time.sleep(delay)
+                elif action == "restart":
+                    attempt = 0
+                continue
+            self._complete_batch(parts.pop(0), mapping, buffers)
 
-                action = self.error_policy.handle_error(
-                    ErrorCategory.TRANSLATION,
-                    f"Batch {batch.batch_id} failed after multiple attempts. {exc}",
+    async def _process_batch_async(
+        self,
+        *,
+        provider: TranslationProvider,
+        batch: Batch,
+        buffers: _SegmentBuffers,
+    ) -> None:
+        """Coroutine counterpart of ``_process_batch``."""
+
+        parts = [batch]
+        attempt = 0
+        split = False
+        while parts:
+            try:
+                mapping = await provider.atranslate_prepared(
+                    self._prepared(provider, parts[0])
                 )
-                if action == "retry":
+            except TranslationProviderError as exc:
+                attempt += 1
+                action, delay = self._after_failure(
+                    parts, exc, attempt=attempt, split=split, buffers=buffers
+                )
+                if action == "split":
+                    parts[:1] = self._halves(parts[0])
+                    split = True
+                elif action == "wait":
+                    await asyncio.sleep(delay)
+                elif action == "restart":
                     attempt = 0
-                    continue
+                continue
+            self._complete_batch(parts.pop(0), mapping, buffers)
 
-                # Skip this batch gracefully.
-                if self.verbose:
-                    print(
-                        f"Skipping batch {batch.batch_id} after repeated failures."
-                    )
-                for segment in batch.segments:
-                    buffer = buffers.get(segment.unit_id)
-                    if buffer and segment.order < len(buffer):
-                        buffer[segment.order] = None
-                return
+    def _prepared(self, provider: TranslationProvider, batch: Batch) -> PreparedBatch:
+        """Return the batch's provider payload, building it on first use."""
+
+        if batch.prepared is None:
+            batch.prepared = provider.prepare(
+                batch.segments,
+                source_language=self.source_language,
+                target_language=self.target_language,
+                model=self.model,
+            )
+        return batch.prepared
+
+    def _complete_batch(
+        self, batch: Batch, mapping: Dict[str, str], buffers: _SegmentBuffers
+    ) -> None:
+        self._map_translations(batch.segments, mapping, buffers)
+        if self.verbose:
+            total_chars = sum(segment.size for segment in batch.segments)
+            self._report(
+                f"Processed batch {batch.batch_id} "
+                f"({len(batch.segments)} segments, {total_chars} chars)."
+            )
+        self._record_success()
+
+    def _after_failure(
+        self,
+        parts: List[Batch],
+        exc: TranslationProviderError,
+        *,
+        attempt: int,
+        split: bool,
+        buffers: _SegmentBuffers,
+    ) -> tuple[str, float]:
+        """Decide how to continue after call ``attempt`` (1-based) failed.
+
+        ``parts`` holds what is left of one batch, the failed part first;
+        finished or skipped parts are removed from it. ``split`` tells
+        whether the batch was already halved. Returns an action and a
+        delay: ``"next"`` (go on with ``parts`` at once), ``"split"``
+        (halve the failed part), ``"wait"`` (retry after the delay) or
+        ``"restart"`` (the user asked to retry; attempts start over).
+        """
+
+        batch = parts[0]
+        if exc.partial:
+            batch = parts[0] = self._keep_untranslated(batch, exc.partial, buffers)
+            if not batch.segments:
+                parts.pop(0)
+                self._record_success()
+                return "next", 0.0
+        # A rate limit or outage says nothing about the batch, and splitting
+        # would only send more requests; other errors (e.g. a malformed
+        # reply to a long batch) are retried on smaller parts.
+        outage = exc.retry_after is not None or isinstance(
+            exc, TranslationServiceUnavailableError
+        )
+        if not split and attempt == 1 and not outage and len(batch.segments) > 1:
+            self._report(
+                f"Could not translate one batch ({exc}). "
+                "Retrying it in two parts..."
+            )
+            return "split", 0.0
+        if attempt <= self.max_retries:
+            self._report(
+                "Could not translate one batch "
+                f"(attempt {attempt} of {self.max_retries} — {exc}). "
+                "Retrying automatically..."
+            )
+            return "wait", self._retry_delay(attempt, exc.retry_after)
+
+        name = str(batch.batch_id)
+        if split:
+            first, last = batch.segments[0], batch.segments[-1]
+            name += f" (segments {first.segment_id} to {last.segment_id})"
+        action = self._handle_error(
+            ErrorCategory.TRANSLATION,
+            f"Batch {name} failed after multiple attempts. {exc}",
+        )
+        if action == "retry":
+            return "restart", 0.0
+
+        # Skip this part gracefully; any other parts are still sent.
+        if self.verbose:
+            self._report(f"Skipping batch {name} after repeated failures.")
+        parts.pop(0)
+        return "next", 0.0
+
+    @staticmethod
+    def _halves(batch: Batch) -> tuple[Batch, Batch]:
+        middle = len(batch.segments) // 2
+        return (
+            Batch(batch_id=batch.batch_id, segments=batch.segments[:middle]),
+            Batch(batch_id=batch.batch_id, segments=batch.segments[middle:]),
+        )
+
+    def _keep_untranslated(
+        self,
+        batch: Batch,
+        partial: Dict[str, str],
+        buffers: _SegmentBuffers,
+    ) -> Batch:
+        """Store the translations a failed call returned; return the rest."""
+
+        done = [segment for segment in batch.segments if segment.segment_id in partial]
+        if done:
+            self._map_translations(done, partial, buffers)
+        return Batch(
+            batch_id=batch.batch_id,
+            segments=[
+                segment
+                for segment in batch.segments
+                if segment.segment_id not in partial
+            ],
+        )
+
+    def _retry_delay(self, attempt: int, retry_after: float | None) -> float:
+        """Seconds to wait before retry ``attempt`` (1-based).
+
+        A delay requested by the service wins; otherwise a random wait up to
+        an exponentially growing, capped ceiling keeps parallel workers from
+        retrying in lockstep.
+        """
+
+        if retry_after is not None:
+            return min(retry_after, self.retry_max_delay)
+        ceiling = min(self.retry_max_delay, self.retry_base_delay * 2 ** (attempt - 1))
+        return random.uniform(0, ceiling)
 
     def _map_translations(
         self,
         segments: Sequence[TextSegment],
         mapping: Dict[str, str],
-        buffers: Dict[str, List[str | None]],
+        buffers: _SegmentBuffers,
     ) -> None:
-        for segment in segments:
-            translated = mapping.get(segment.segment_id)
-            if translated is None:
-                message = (
-                    f"Translation missing for segment {segment.segment_id}. "
-                    "Skipping this element."
-                )
-                self.error_policy.handle_error(
-                    ErrorCategory.TRANSLATION,
-                    message,
-                )
-                continue
-            buffer = buffers.get(segment.unit_id)
-            if buffer is None or segment.order >= len(buffer):
-                # Should not occur but handle gracefully.
-                self.error_policy.handle_error(
-                    ErrorCategory.REINSERTION,
-                    f"Unexpected segment reference {segment.segment_id}.",
-                )
-                continue
-            buffer[segment.order] = translated
+        # Every segment's unit has slots (see ``_stream_segments``). A
+        # unit's segments are adjacent in a batch, so this is one slot
+        # lookup per unit rather than per segment.
+        for unit_id, unit_segments in groupby(segments, key=_UNIT_ID):
+            start = buffers.start(unit_id)
+            for segment in unit_segments:
+                translated = mapping.get(segment.segment_id)
+                if translated is None:
+                    message = (
+                        f"Translation missing for segment {segment.segment_id}. "
+                        "Skipping this element."
+                    )
+                    self._handle_error(
+                        ErrorCategory.TRANSLATION,
+                        message,
+                    )
+                    continue
+                buffers.store(start + segment.order, translated)
+        self._save_progress(segments, mapping)
 
 
 def validate_paths(
@@ -258,19 +850,29 @@ def validate_paths(
 ) -> None:
     """Validate input/output path combinations and overwrite policy."""
 
-    if not input_path.exists():
+    # One stat per path: existence, type and identity all come from it.
+    try:
+        input_stat = os.stat(input_path)
+    except OSError:
         raise FileNotFoundError(
             "Input file not found. Please provide a readable .docx or .pptx file."
-        )
-    if not input_path.is_file():
+        ) from None
+    if not stat.S_ISREG(input_stat.st_mode):
         raise WormholeError("Input path must be a file.")
 
-    if input_path.resolve() == output_path.resolve():
+    try:
+        output_stat: os.stat_result | None = os.stat(output_path)
+    except OSError:
+        output_stat = None
+    if output_stat is None:
+        return
+
+    if os.path.samestat(input_stat, output_stat):
         raise OverwriteRefusedError(
             "The output path matches the input document. Refusing to overwrite the source file."
         )
 
-    if output_path.exists() and not force_overwrite:
+    if not force_overwrite:
         raise OverwriteRefusedError(
             "The output file already exists — rename or use the overwrite flag."
         )